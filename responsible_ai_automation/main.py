@@ -20,14 +20,24 @@ from src.monitoring.alerts import AlertManager
 class ResponsibleAIAutomationSystem:
     """Responsible AI Automation 시스템 메인 클래스"""
 
-    def __init__(self, config_path: str):
+    def __init__(
+        self,
+        config_path: Optional[str] = None,
+        config: Optional[Dict[str, Any]] = None,
+    ):
         """
         Args:
             config_path: 설정 파일 경로
+            config: 설정 딕셔너리 (지정 시 파일을 읽지 않고 그대로 사용)
         """
         # 설정 로드
-        with open(config_path, "r", encoding="utf-8") as f:
-            self.config = yaml.safe_load(f)
+        if config is not None:
+            self.config = config
+        elif config_path is not None:
+            with open(config_path, "r", encoding="utf-8") as f:
+                self.config = yaml.safe_load(f)
+        else:
+            raise ValueError("config_path 또는 config 중 하나를 지정해야 합니다.")
 
         # 로깅 설정
         log_level = self.config.get("monitoring", {}).get("log_level", "INFO")
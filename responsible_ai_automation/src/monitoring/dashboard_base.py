@@ -3,8 +3,70 @@
 """
 
 from abc import ABC, abstractmethod
+from types import MappingProxyType
 from typing import Dict, Any, List, Optional
 from datetime import datetime
+import numpy as np
+
+# 렌더링 시마다 다시 만들지 않도록 모듈 로드 시 한 번만 생성하는 카테고리 상수
+CATEGORIES = ("fairness", "transparency", "accountability", "privacy", "robustness")
+CATEGORY_NAMES = MappingProxyType({
+    "fairness": "공정성",
+    "transparency": "투명성",
+    "accountability": "책임성",
+    "privacy": "프라이버시",
+    "robustness": "견고성",
+})
+SCORE_KEYS = tuple(f"overall_{category}_score" for category in CATEGORIES)
+
+# 트렌드 차트에 전송할 시계열당 최대 포인트 수
+TREND_MAX_POINTS = 500
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int = TREND_MAX_POINTS) -> np.ndarray:
+    """
+    LTTB(Largest-Triangle-Three-Buckets) 다운샘플링 인덱스 계산
+
+    첫/마지막 포인트를 유지하고, 나머지 구간을 n_out - 2개 버킷으로 나눠
+    버킷마다 이전 선택 포인트와 다음 버킷 평균으로 만든 삼각형의 면적이
+    가장 큰 포인트를 선택하여 선 그래프의 형태를 보존합니다.
+
+    Args:
+        x: x 좌표 (수치형, 오름차순)
+        y: y 좌표
+        n_out: 출력 포인트 수
+
+    Returns:
+        선택된 포인트의 인덱스 배열
+    """
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+
+    indices = np.empty(n_out, dtype=np.int64)
+    indices[0] = 0
+    indices[-1] = n - 1
+
+    # 첫/마지막 포인트를 제외한 구간의 버킷 경계
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    selected = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+
+        area = np.abs(
+            (x[selected] - avg_x) * (y[start:end] - y[selected])
+            - (x[selected] - x[start:end]) * (avg_y - y[selected])
+        )
+        selected = start + int(area.argmax())
+        indices[i + 1] = selected
+
+    return indices
 
 
 class DashboardBase(ABC):
@@ -2,7 +2,7 @@
 대시보드 팩토리 - 다양한 대시보드 구현체를 생성하고 관리
 """
 
-from typing import Dict, Any, Optional, Type
+from typing import Dict, Any, List, Optional, Type
 from .dashboard_base import DashboardBase
 
 
@@ -12,8 +12,138 @@ except ImportError:
     STREAMLIT_AVAILABLE = False
 
 from typing import Dict, Any, Optional
+from pathlib import Path
+import atexit
+import functools
+import json
+import math
+import subprocess
+import sys
 import numpy as np
-from .dashboard_base import DashboardBase
+from .dashboard_base import (
+    DashboardBase,
+    CATEGORIES,
+    SCORE_KEYS,
+    TREND_MAX_POINTS,
+    lttb_indices,
+)
+
+
+def _to_builtin(value: Any) -> Any:
+    """JSON 직렬화가 불가능한 값(numpy 스칼라 등)을 기본 타입으로 변환"""
+    if isinstance(value, np.generic):
+        return value.item()
+    return str(value)
+
+
+def _metrics_cache_key(metrics: Dict[str, Any]) -> str:
+    """메트릭 딕셔너리를 캐시 키로 사용할 JSON 문자열로 변환"""
+    return json.dumps(metrics, sort_keys=True, default=_to_builtin)
+
+
+def _build_category_df(metrics_json: str) -> "pd.DataFrame":
+    """
+    카테고리별 점수 DataFrame 생성
+
+    Args:
+        metrics_json: _metrics_cache_key로 직렬화된 메트릭
+
+    Returns:
+        카테고리/점수 DataFrame
+    """
+    metrics = json.loads(metrics_json)
+    category_scores = []
+
+    for category, score_key in zip(CATEGORIES, SCORE_KEYS):
+        if category in metrics:
+            score = metrics[category].get(score_key, 0.0)
+            category_scores.append({"카테고리": category, "점수": score})
+
+    return pd.DataFrame(category_scores)
+
+
+def _build_detail_df(metrics_json: str) -> "pd.DataFrame":
+    """
+    카테고리별 상세 메트릭 DataFrame 생성
+
+    Args:
+        metrics_json: _metrics_cache_key로 직렬화된 메트릭
+
+    Returns:
+        카테고리/메트릭/값 DataFrame
+    """
+    metrics = json.loads(metrics_json)
+    detail_data = []
+
+    for category in CATEGORIES:
+        if category in metrics:
+            category_metrics = metrics[category].get("metrics", {})
+            for metric_name, metric_value in category_metrics.items():
+                if isinstance(metric_value, (int, float)):
+                    detail_data.append({
+                        "카테고리": category,
+                        "메트릭": metric_name,
+                        "값": metric_value,
+                    })
+
+    return pd.DataFrame(detail_data)
+
+
+@functools.lru_cache(maxsize=1024)
+def _build_gauge(score_milli: int) -> "go.Figure":
+    """
+    종합 점수 게이지 Figure 생성 (양자화된 점수별로 캐시)
+
+    반환되는 Figure는 캐시에 공유되므로 호출자가 수정하면 안 됩니다.
+
+    Args:
+        score_milli: 소수점 셋째 자리까지 양자화한 점수 (round(score * 1000))
+
+    Returns:
+        게이지 Figure
+    """
+    return _gauge_figure(score_milli / 10)
+
+
+def _gauge_figure(value: float) -> "go.Figure":
+    """
+    종합 점수 게이지 Figure 생성 (캐시 없음)
+
+    Args:
+        value: 게이지 값 (0~100, NaN이면 값 없이 표시)
+
+    Returns:
+        게이지 Figure
+    """
+    fig = go.Figure(
+        go.Indicator(
+            mode="gauge+number",
+            value=value,
+            domain={"x": [0, 1], "y": [0, 1]},
+            title={"text": "Responsible AI 점수"},
+            gauge={
+                "axis": {"range": [None, 100]},
+                "bar": {"color": "darkblue"},
+                "steps": [
+                    {"range": [0, 60], "color": "lightgray"},
+                    {"range": [60, 80], "color": "gray"},
+                ],
+                "threshold": {
+                    "line": {"color": "red", "width": 4},
+                    "thickness": 0.75,
+                    "value": 75,
+                },
+            },
+        )
+    )
+    fig.update_layout(height=300)
+    return fig
+
+
+if STREAMLIT_AVAILABLE:
+    # 동일한 메트릭으로 재실행될 때는 DataFrame을 다시 만들지 않고 캐시에서 조회
+    _build_category_df = st.cache_data(max_entries=32)(_build_category_df)
+    _build_detail_df = st.cache_data(max_entries=32)(_build_detail_df)
 
 
 class StreamlitDashboard(DashboardBase):
@@ -31,6 +161,7 @@ class StreamlitDashboard(DashboardBase):
             )
         super().__init__(config)
         self.port = self.config.get("port", 8501)
+        self._proc: Optional[subprocess.Popen] = None
 
     def render(self, metrics: Optional[Dict[str, Any]] = None) -> None:
         """
@@ -92,46 +223,21 @@ class StreamlitDashboard(DashboardBase):
             privacy_score = metrics.get("privacy", {}).get("overall_privacy_score", 0.0)
             st.metric("프라이버시 점수", f"{privacy_score:.3f}")
 
-        # 종합 점수 게이지 차트
-        fig = go.Figure(
-            go.Indicator(
-                mode="gauge+number",
-                value=overall_score * 100,
-                domain={"x": [0, 1], "y": [0, 1]},
-                title={"text": "Responsible AI 점수"},
-                gauge={
-                    "axis": {"range": [None, 100]},
-                    "bar": {"color": "darkblue"},
-                    "steps": [
-                        {"range": [0, 60], "color": "lightgray"},
-                        {"range": [60, 80], "color": "gray"},
-                    ],
-                    "threshold": {
-                        "line": {"color": "red", "width": 4},
-                        "thickness": 0.75,
-                        "value": 75,
-                    },
-                },
-            )
-        )
-        fig.update_layout(height=300)
+        # 종합 점수 게이지 차트 (NaN 등 양자화할 수 없는 점수는 캐시 없이 생성)
+        if math.isfinite(overall_score):
+            fig = _build_gauge(round(overall_score * 1000))
+        else:
+            fig = _gauge_figure(overall_score * 100)
         st.plotly_chart(fig, use_container_width=True)
 
     def _render_category_metrics(self, metrics: Dict[str, Any]):
         """카테고리별 메트릭 렌더링"""
         st.header("📈 카테고리별 메트릭")
 
-        categories = ["fairness", "transparency", "accountability", "privacy", "robustness"]
-        category_scores = []
-
-        for category in categories:
-            if category in metrics:
-                score = metrics[category].get(f"overall_{category}_score", 0.0)
-                category_scores.append({"카테고리": category, "점수": score})
-
-        if category_scores:
-            df = pd.DataFrame(category_scores)
+        metrics_json = _metrics_cache_key(metrics)
+        df = _build_category_df(metrics_json)
 
+        if not df.empty:
             fig = px.bar(
                 df,
                 x="카테고리",
@@ -145,39 +251,74 @@ class StreamlitDashboard(DashboardBase):
 
             # 상세 메트릭 테이블
             st.subheader("상세 메트릭")
-            detail_data = []
-            for category in categories:
-                if category in metrics:
-                    category_metrics = metrics[category].get("metrics", {})
-                    for metric_name, metric_value in category_metrics.items():
-                        if isinstance(metric_value, (int, float)):
-                            detail_data.append({
-                                "카테고리": category,
-                                "메트릭": metric_name,
-                                "값": metric_value,
-                            })
-
-            if detail_data:
-                detail_df = pd.DataFrame(detail_data)
+            detail_df = _build_detail_df(metrics_json)
+
+            if not detail_df.empty:
                 st.dataframe(detail_df, use_container_width=True)
 
     def _render_trends(self) -> None:
-        """트렌드 차트 렌더링"""
-        if len(self.metrics_history) < 2:
+        """
+        트렌드 차트 렌더링
+
+        세션에 보관한 Figure에 새로 기록된 포인트만 추가하고, 히스토리가
+        잘렸거나 다운샘플링이 필요한 경우에만 Figure를 다시 만듭니다.
+        """
+        n_entries = len(self.metrics_history)
+        if n_entries < 2:
             return
 
         st.header("📉 트렌드 분석")
 
+        state = st.session_state
+        fig = state.get("rai_trend_fig")
+        rendered = state.get("rai_trend_rendered", 0)
+        first_timestamp = self.metrics_history[0]["timestamp"]
+
+        if (
+            fig is None
+            or state.get("rai_trend_first_timestamp") != first_timestamp
+            or rendered > n_entries
+            or n_entries > TREND_MAX_POINTS
+        ):
+            fig = self._build_trend_figure()
+        elif rendered < n_entries:
+            # 새로 추가된 포인트만 기존 트레이스에 덧붙임
+            new_scores = [
+                entry["metrics"].get("overall_responsible_ai_score", 0.0)
+                for entry in self.metrics_history[rendered:]
+            ]
+            trace = fig.data[0]
+            with fig.batch_update():
+                trace.x = np.concatenate([trace.x, np.arange(rendered, n_entries)])
+                trace.y = np.concatenate([trace.y, new_scores])
+
+        state["rai_trend_fig"] = fig
+        state["rai_trend_rendered"] = n_entries
+        state["rai_trend_first_timestamp"] = first_timestamp
+
+        st.plotly_chart(fig, use_container_width=True, key="rai_trend_chart")
+
+    def _build_trend_figure(self) -> "go.Figure":
+        """
+        전체 히스토리로 트렌드 Figure 생성
+
+        Returns:
+            종합 점수 추이 Figure
+        """
         # 시간별 종합 점수 추이
-        overall_scores = [
+        overall_scores = np.array([
             entry["metrics"].get("overall_responsible_ai_score", 0.0)
             for entry in self.metrics_history
-        ]
+        ])
+
+        # 차트 폭보다 많은 포인트는 LTTB로 다운샘플링하여 전송
+        idx = lttb_indices(np.arange(len(overall_scores)), overall_scores)
 
         fig = go.Figure()
         fig.add_trace(
-            go.Scatter(
-                y=overall_scores,
+            go.Scattergl(
+                x=idx,
+                y=overall_scores[idx],
                 mode="lines+markers",
                 name="종합 점수",
                 line=dict(color="blue", width=2),
@@ -195,13 +336,19 @@ class StreamlitDashboard(DashboardBase):
             yaxis_title="점수",
             height=400,
         )
-        st.plotly_chart(fig, use_container_width=True)
+        return fig
+
+    def start(self) -> subprocess.Popen:
+        """
+        대시보드 시작
 
-    def start(self) -> None:
-        """대시보드 시작"""
-        import subprocess
-        import sys
-        from pathlib import Path
+        Streamlit 서버를 백그라운드 프로세스로 실행하고 즉시 반환합니다.
+
+        Returns:
+            Streamlit 서버 프로세스 핸들
+        """
+        if self._proc is not None and self._proc.poll() is None:
+            return self._proc
 
         # Streamlit 앱 스크립트 경로
         app_script = Path(__file__).parent.parent.parent / "scripts" / "streamlit_app.py"
@@ -210,11 +357,22 @@ class StreamlitDashboard(DashboardBase):
         if not app_script.exists():
             self._create_streamlit_app_script(app_script)
 
-        # Streamlit 앱 실행
-        subprocess.run([
-            sys.executable, "-m", "streamlit", "run", str(app_script),
-            "--server.port", str(self.port)
-        ])
+        # Streamlit 앱 실행 (호출자를 블로킹하지 않음)
+        self._proc = subprocess.Popen(
+            [
+                sys.executable, "-m", "streamlit", "run", str(app_script),
+                "--server.port", str(self.port)
+            ],
+            stdout=subprocess.DEVNULL,
+        )
+        atexit.register(self.stop)
+        return self._proc
+
+    def stop(self) -> None:
+        """대시보드 중지"""
+        if self._proc is not None and self._proc.poll() is None:
+            self._proc.terminate()
+        self._proc = None
 
     def _create_streamlit_app_script(self, script_path: Path) -> None:
         """Streamlit 앱 스크립트 생성"""
@@ -3,15 +3,22 @@
 """
 
 import streamlit as st
-import pandas as pd
-import plotly.express as px
+import numpy as np
 import plotly.graph_objects as go
-from typing import Dict, Any, List, Optional
+from typing import Callable, Dict, Any, List, Optional
 from datetime import datetime, timedelta
 import json
+import logging
 from pathlib import Path
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from .dashboard import MonitoringDashboard
+from .dashboard_base import CATEGORIES, CATEGORY_NAMES, SCORE_KEYS, lttb_indices
 
 
 class WebDashboard:
@@ -25,6 +32,9 @@ class WebDashboard:
         self.config = config
         self.dashboard = MonitoringDashboard(config)
         self.metrics_history: List[Dict[str, Any]] = []
+        self.logger = logging.getLogger(__name__)
+        # 히스토리 파일을 읽지 못했으면 기존 파일을 덮어쓰지 않도록 저장을 건너뜀
+        self._history_load_failed = False
         self.load_metrics_history()
 
     def load_metrics_history(self):
@@ -32,10 +42,34 @@ class WebDashboard:
         metrics_file = Path(self.config.get("model", {}).get("save_path", "./models")) / "metrics_history.json"
         if metrics_file.exists():
             try:
-                with open(metrics_file, "r") as f:
-                    self.metrics_history = json.load(f)
-            except Exception:
+                raw = metrics_file.read_bytes()
+                if ORJSON_AVAILABLE:
+                    try:
+                        self.metrics_history = orjson.loads(raw)
+                    except orjson.JSONDecodeError:
+                        # 표준 json으로 저장된 이전 파일은 NaN 리터럴을 포함할 수 있음
+                        self.metrics_history = json.loads(raw)
+                else:
+                    self.metrics_history = json.loads(raw)
+            except Exception as e:
+                self.logger.error("메트릭 히스토리 로드 실패 (%s): %s", metrics_file, e)
+                self._history_load_failed = True
                 self.metrics_history = []
+            else:
+                self._history_load_failed = False
+                self._restore_nan_scores()
+
+    def _restore_nan_scores(self):
+        """
+        orjson은 NaN 점수를 null로 저장하므로, 로드 후 None 점수를 np.nan으로 복원
+        """
+        for metrics in self.metrics_history:
+            if metrics.get("overall_responsible_ai_score", 0.0) is None:
+                metrics["overall_responsible_ai_score"] = np.nan
+            for category, score_key in zip(CATEGORIES, SCORE_KEYS):
+                category_data = metrics.get(category)
+                if isinstance(category_data, dict) and category_data.get(score_key, 0.0) is None:
+                    category_data[score_key] = np.nan
 
     def save_metrics(self, metrics: Dict[str, Any]):
         """메트릭 저장"""
@@ -51,9 +85,20 @@ class WebDashboard:
         
         # 파일에 저장
         metrics_file = Path(self.config.get("model", {}).get("save_path", "./models")) / "metrics_history.json"
+        if self._history_load_failed:
+            self.logger.warning("읽지 못한 메트릭 히스토리 파일을 덮어쓰지 않도록 저장을 건너뜁니다: %s", metrics_file)
+            return
         metrics_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(metrics_file, "w") as f:
-            json.dump(self.metrics_history, f, indent=2)
+        if ORJSON_AVAILABLE:
+            # numpy 스칼라/배열도 그대로 직렬화
+            with open(metrics_file, "wb") as f:
+                f.write(orjson.dumps(
+                    self.metrics_history,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+                ))
+        else:
+            with open(metrics_file, "w") as f:
+                json.dump(self.metrics_history, f, indent=2)
 
     def render_overview(self):
         """전체 개요 대시보드"""
@@ -99,24 +144,14 @@ class WebDashboard:
         
         latest_metrics = self.metrics_history[-1]
         
-        categories = ["fairness", "transparency", "accountability", "privacy", "robustness"]
-        category_names = {
-            "fairness": "공정성",
-            "transparency": "투명성",
-            "accountability": "책임성",
-            "privacy": "프라이버시",
-            "robustness": "견고성"
-        }
-        
         scores = []
         labels = []
         
-        for category in categories:
+        for category, score_key in zip(CATEGORIES, SCORE_KEYS):
             if category in latest_metrics:
-                score_key = f"overall_{category}_score"
                 score = latest_metrics[category].get(score_key, 0.0)
                 scores.append(score)
-                labels.append(category_names[category])
+                labels.append(CATEGORY_NAMES[category])
         
         if scores:
             fig = go.Figure(data=go.Bar(
@@ -144,54 +179,57 @@ class WebDashboard:
             st.info("트렌드를 표시하려면 최소 2개의 평가 결과가 필요합니다.")
             return
         
-        df = pd.DataFrame(self.metrics_history)
-        df['timestamp'] = pd.to_datetime(df['timestamp'])
-        
-        # 전체 점수 트렌드
-        fig = px.line(
-            df,
-            x='timestamp',
-            y='overall_responsible_ai_score',
+        # Plotly에는 x/y 배열만 필요하므로 DataFrame 없이 히스토리에서 바로 배열 생성
+        history = self.metrics_history
+        n_entries = len(history)
+        timestamps = np.array([m['timestamp'] for m in history], dtype='datetime64[ns]')
+        # LTTB 면적 계산용 수치형 x 좌표
+        x_numeric = timestamps.astype(np.int64)
+        
+        # 전체 점수 트렌드 (Scattergl: 포인트가 많아도 SVG DOM 재배치 없이 WebGL로 렌더링)
+        # 차트 폭보다 많은 포인트는 LTTB로 다운샘플링하여 전송
+        overall_scores = np.fromiter(
+            (m.get('overall_responsible_ai_score', 0.0) for m in history),
+            dtype=np.float32,
+            count=n_entries
+        )
+        idx = lttb_indices(x_numeric, overall_scores)
+        fig = go.Figure(go.Scattergl(
+            x=timestamps[idx],
+            y=overall_scores[idx],
+            mode='lines',
+            name='점수'
+        ))
+        fig.update_layout(
             title='전체 Responsible AI 점수 트렌드',
-            labels={'overall_responsible_ai_score': '점수', 'timestamp': '시간'}
+            xaxis_title='시간',
+            yaxis_title='점수'
         )
         fig.add_hline(y=0.75, line_dash="dash", line_color="red", annotation_text="기준선 (0.75)")
         st.plotly_chart(fig, use_container_width=True)
         
         # 카테고리별 트렌드
-        categories = ["fairness", "transparency", "accountability", "privacy", "robustness"]
-        category_names = {
-            "fairness": "공정성",
-            "transparency": "투명성",
-            "accountability": "책임성",
-            "privacy": "프라이버시",
-            "robustness": "견고성"
-        }
-        
-        category_scores = {}
-        for category in categories:
-            scores = []
-            for metrics in self.metrics_history:
-                if category in metrics:
-                    score_key = f"overall_{category}_score"
-                    score = metrics[category].get(score_key, 0.0)
-                    scores.append(score)
-                else:
-                    scores.append(0.0)
-            category_scores[category_names[category]] = scores
-        
-        if category_scores:
-            df_categories = pd.DataFrame(category_scores)
-            df_categories['timestamp'] = df['timestamp']
-            
-            fig = px.line(
-                df_categories,
-                x='timestamp',
-                y=list(category_names.values()),
-                title='카테고리별 점수 트렌드',
-                labels={'value': '점수', 'timestamp': '시간', 'variable': '카테고리'}
+        fig = go.Figure()
+        for category, score_key in zip(CATEGORIES, SCORE_KEYS):
+            scores = np.fromiter(
+                (m[category].get(score_key, 0.0) if category in m else 0.0 for m in history),
+                dtype=np.float32,
+                count=n_entries
             )
-            st.plotly_chart(fig, use_container_width=True)
+            idx = lttb_indices(x_numeric, scores)
+            fig.add_trace(go.Scattergl(
+                x=timestamps[idx],
+                y=scores[idx],
+                mode='lines',
+                name=CATEGORY_NAMES[category]
+            ))
+        fig.update_layout(
+            title='카테고리별 점수 트렌드',
+            xaxis_title='시간',
+            yaxis_title='점수',
+            legend_title_text='카테고리'
+        )
+        st.plotly_chart(fig, use_container_width=True)
 
     def render_detailed_metrics(self):
         """상세 메트릭"""
@@ -202,18 +240,9 @@ class WebDashboard:
         
         latest_metrics = self.metrics_history[-1]
         
-        categories = ["fairness", "transparency", "accountability", "privacy", "robustness"]
-        category_names = {
-            "fairness": "공정성",
-            "transparency": "투명성",
-            "accountability": "책임성",
-            "privacy": "프라이버시",
-            "robustness": "견고성"
-        }
-        
-        for category in categories:
+        for category in CATEGORIES:
             if category in latest_metrics:
-                with st.expander(category_names[category]):
+                with st.expander(CATEGORY_NAMES[category]):
                     category_data = latest_metrics[category]
                     st.json(category_data)
 
@@ -236,7 +265,12 @@ class WebDashboard:
                 st.rerun()
         
         # 메인 대시보드
-        self.render_overview()
+        # 자동 새로고침 시 전체 페이지 대신 개요/트렌드 차트 프래그먼트만 주기적으로 재실행
+        live_section = st.fragment(
+            self._render_live_section,
+            run_every=refresh_interval if auto_refresh else None
+        )
+        live_section(self.render_overview, reload=auto_refresh)
         st.divider()
         
         col1, col2 = st.columns(2)
@@ -245,15 +279,23 @@ class WebDashboard:
             self.render_category_metrics()
         
         with col2:
-            self.render_trend_chart()
+            live_section(self.render_trend_chart, reload=auto_refresh)
         
         st.divider()
         self.render_detailed_metrics()
+
+    def _render_live_section(self, render: Callable[[], None], reload: bool = False):
+        """
+        자동 새로고침 대상 섹션 (개요, 트렌드 차트)
+
+        Args:
+            render: 섹션 렌더링 메서드
+            reload: 렌더링 전에 저장된 메트릭 히스토리를 다시 로드할지 여부
+        """
+        if reload:
+            self.load_metrics_history()
         
-        if auto_refresh:
-            import time
-            time.sleep(refresh_interval)
-            st.rerun()
+        render()
 
 
 def main():
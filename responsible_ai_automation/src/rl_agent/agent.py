@@ -2,13 +2,42 @@
 강화 학습 에이전트 모듈
 """
 
-from typing import Dict, Any, Optional
-from stable_baselines3 import PPO, SAC, TD3, A2C
-from stable_baselines3.common.callbacks import BaseCallback
+import importlib
+from typing import Dict, Any, Optional, TYPE_CHECKING
+import numpy as np
+from gymnasium.wrappers import TimeLimit
 
 from .environment import RLIEnvironment
 from .reward import RewardCalculator
 
+if TYPE_CHECKING:
+    from stable_baselines3.common.callbacks import BaseCallback
+
+# stable_baselines3(및 torch)는 임포트 비용이 크므로 에이전트 생성 시점까지 지연 로딩
+_ALGORITHM_MODULES = {
+    "PPO": "stable_baselines3.ppo",
+    "SAC": "stable_baselines3.sac",
+    "TD3": "stable_baselines3.td3",
+    "A2C": "stable_baselines3.a2c",
+}
+_ALGO_CLASSES: Dict[str, type] = {}
+
+
+def _get_algorithm_class(name: str) -> type:
+    """
+    알고리즘 클래스 지연 로딩
+
+    Args:
+        name: 알고리즘 이름 (PPO, SAC, TD3, A2C)
+
+    Returns:
+        stable_baselines3 알고리즘 클래스
+    """
+    if name not in _ALGO_CLASSES:
+        module = importlib.import_module(_ALGORITHM_MODULES[name])
+        _ALGO_CLASSES[name] = getattr(module, name)
+    return _ALGO_CLASSES[name]
+
 
 class RLAIAgent:
     """Responsible AI 강화 학습 에이전트"""
@@ -45,26 +74,18 @@ class RLAIAgent:
         gamma = rl_config.get("gamma", 0.99)
         tau = rl_config.get("tau", 0.005)
 
+        algorithm_class = _get_algorithm_class(self.algorithm)
+
         if self.algorithm == "PPO":
-            self.agent = PPO(
+            self.agent = algorithm_class(
                 "MlpPolicy",
                 env,
                 learning_rate=learning_rate,
                 batch_size=batch_size,
                 verbose=1,
             )
-        elif self.algorithm == "SAC":
-            self.agent = SAC(
-                "MlpPolicy",
-                env,
-                learning_rate=learning_rate,
-                buffer_size=buffer_size,
-                gamma=gamma,
-                tau=tau,
-                verbose=1,
-            )
-        elif self.algorithm == "TD3":
-            self.agent = TD3(
+        elif self.algorithm in ("SAC", "TD3"):
+            self.agent = algorithm_class(
                 "MlpPolicy",
                 env,
                 learning_rate=learning_rate,
@@ -74,7 +95,7 @@ class RLAIAgent:
                 verbose=1,
             )
         elif self.algorithm == "A2C":
-            self.agent = A2C(
+            self.agent = algorithm_class(
                 "MlpPolicy",
                 env,
                 learning_rate=learning_rate,
@@ -106,7 +127,7 @@ class RLAIAgent:
         else:
             return "PPO" if problem_type == "stable" else "A2C"
 
-    def train(self, total_timesteps: int = 100000, callback: Optional[BaseCallback] = None):
+    def train(self, total_timesteps: int = 100000, callback: Optional["BaseCallback"] = None):
         """
         에이전트 학습
 
@@ -131,6 +152,60 @@ class RLAIAgent:
         """
         return self.agent.predict(observation)
 
+    def evaluate(
+        self,
+        n_episodes: int = 10,
+        deterministic: bool = True,
+    ) -> Dict[str, float]:
+        """
+        에이전트 평가
+
+        에피소드마다 하나의 환경을 DummyVecEnv로 묶어 동시에 실행하고,
+        매 스텝 (n_episodes, obs_dim) 관찰 배치에 대해 정책 순전파를
+        한 번만 수행합니다.
+
+        Args:
+            n_episodes: 평가 에피소드 수
+            deterministic: 결정적 액션 사용 여부
+
+        Returns:
+            평균 보상, 보상 표준편차, 평균 에피소드 길이 딕셔너리
+        """
+        from stable_baselines3.common.vec_env import DummyVecEnv
+
+        rl_config = self.config.get("reinforcement_learning", {})
+        max_episode_steps = rl_config.get("max_episode_steps", 200)
+        env_config = getattr(self.env, "config", {})
+
+        def make_env():
+            # 목표 미달 시 에피소드가 끝나지 않으므로 최대 스텝 수로 잘라냄
+            return TimeLimit(RLIEnvironment(env_config), max_episode_steps=max_episode_steps)
+
+        vec_env = DummyVecEnv([make_env for _ in range(n_episodes)])
+        # 환경 i의 첫 에피소드 결과를 i번째 칸에 기록
+        episode_rewards = np.zeros(n_episodes, dtype=np.float64)
+        episode_lengths = np.zeros(n_episodes, dtype=np.int64)
+        try:
+            obs = vec_env.reset()
+            active = np.ones(n_episodes, dtype=bool)
+
+            while active.any():
+                actions, _ = self.agent.predict(obs, deterministic=deterministic)
+                obs, rewards, dones, _ = vec_env.step(actions)
+
+                # 종료된 환경은 자동 리셋되므로 진행 중인 에피소드만 누적
+                episode_rewards[active] += rewards[active]
+                episode_lengths[active] += 1
+                active &= ~dones
+        finally:
+            vec_env.close()
+
+        return {
+            "mean_reward": float(episode_rewards.mean()),
+            "std_reward": float(episode_rewards.std()),
+            "mean_episode_length": float(episode_lengths.mean()),
+        }
+
     def save(self, path: str):
         """
         에이전트 저장
@@ -147,12 +222,4 @@ class RLAIAgent:
         Args:
             path: 로드 경로
         """
-        if self.algorithm == "PPO":
-            self.agent = PPO.load(path, env=self.env)
-        elif self.algorithm == "SAC":
-            self.agent = SAC.load(path, env=self.env)
-        elif self.algorithm == "TD3":
-            self.agent = TD3.load(path, env=self.env)
-        elif self.algorithm == "A2C":
-            self.agent = A2C.load(path, env=self.env)
-
+        self.agent = _get_algorithm_class(self.algorithm).load(path, env=self.env)
@@ -7,6 +7,66 @@ import gymnasium as gym
 from gymnasium import spaces
 from typing import Dict, Any, Optional, Tuple
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def _step_kernel(
+    current: np.ndarray, action: np.ndarray, target: np.ndarray, terminal: np.ndarray
+) -> Tuple[float, bool]:
+    """
+    스텝 연산 커널 (메트릭 갱신, 보상, 종료 여부)
+
+    current를 제자리에서 갱신하며, 5차원 벡터에서는 ufunc 호출 비용이
+    실제 연산보다 크므로 단일 루프로 처리합니다.
+
+    Args:
+        current: 현재 메트릭 (제자리 갱신)
+        action: 에이전트 액션
+        target: 타겟 메트릭
+        terminal: 종료 기준 메트릭 (모든 메트릭이 이 값 이상이면 종료)
+
+    Returns:
+        보상과 종료 여부
+    """
+    n = current.shape[0]
+    reward = 0.0
+    terminated = True
+    for i in range(n):
+        value = current[i] + action[i] * 0.1
+        if value < 0.0:
+            value = 0.0
+        elif value > 1.0:
+            value = 1.0
+        current[i] = value
+        reward -= abs(value - target[i])
+        if value < terminal[i]:
+            terminated = False
+    return reward / n, terminated
+
+
+if NUMBA_AVAILABLE:
+    _step_kernel = njit(cache=True, fastmath=True)(_step_kernel)
+
+
+def _readonly(array: np.ndarray) -> np.ndarray:
+    """모든 환경 인스턴스가 공유하는 상수 배열을 읽기 전용으로 고정"""
+    array.setflags(write=False)
+    return array
+
+
+# 환경마다 새로 만들지 않고 공유하는 공간 경계 및 타겟 (fairness, transparency,
+# accountability, privacy, robustness 순서)
+_OBS_LOW = _readonly(np.zeros(5, dtype=np.float32))
+_OBS_HIGH = _readonly(np.ones(5, dtype=np.float32))
+_ACTION_LOW = _readonly(np.full(5, -1.0, dtype=np.float32))
+_ACTION_HIGH = _readonly(np.ones(5, dtype=np.float32))
+_TARGET_METRICS = _readonly(np.full(5, 0.8, dtype=np.float32))
+_TERMINAL_METRICS = _readonly(_TARGET_METRICS * np.float32(0.95))
+
 
 class RLIEnvironment(gym.Env):
     """Responsible AI 강화 학습 환경"""
@@ -21,16 +81,39 @@ class RLIEnvironment(gym.Env):
         self.config = config
         # 액션 공간: 각 Responsible AI 지표에 대한 조정 값
         self.action_space = spaces.Box(
-            low=-1.0, high=1.0, shape=(5,), dtype=np.float32
+            low=_ACTION_LOW, high=_ACTION_HIGH, dtype=np.float32
         )  # fairness, transparency, accountability, privacy, robustness
 
         # 관찰 공간: 현재 Responsible AI 지표 값들
+        # 값이 [0, 1] 범위이므로 float16으로 지정하면 리플레이 버퍼(SAC/TD3) 메모리가 절반으로 줄어듦
+        # (내부 메트릭 상태는 작은 액션 누적이 손실되지 않도록 항상 float32로 유지)
+        rl_config = config.get("reinforcement_learning", {})
+        obs_dtype = np.dtype(rl_config.get("observation_dtype", "float32"))
         self.observation_space = spaces.Box(
-            low=0.0, high=1.0, shape=(5,), dtype=np.float32
+            low=_OBS_LOW.astype(obs_dtype, copy=False),
+            high=_OBS_HIGH.astype(obs_dtype, copy=False),
+            dtype=obs_dtype
         )
 
-        self.current_metrics = np.array([0.5, 0.5, 0.5, 0.5, 0.5])
-        self.target_metrics = np.array([0.8, 0.8, 0.8, 0.8, 0.8])
+        self.current_metrics = np.full(5, 0.5, dtype=np.float32)
+        self._target_metrics = _TARGET_METRICS
+        self._terminal_metrics = _TERMINAL_METRICS
+
+        self._obs_dtype = obs_dtype
+        # numpy 스텝 연산에서 중간 결과용으로 재사용하는 버퍼 (반환하지 않음)
+        self._work = np.empty(5, dtype=np.float32)
+
+    @property
+    def target_metrics(self) -> np.ndarray:
+        """타겟 메트릭"""
+        return self._target_metrics
+
+    @target_metrics.setter
+    def target_metrics(self, value: np.ndarray):
+        """타겟 메트릭 설정 (종료 기준 메트릭도 함께 갱신)"""
+        # float32로 고정하여 스텝 연산에서 float64 승격이 일어나지 않도록 함
+        self._target_metrics = np.asarray(value, dtype=np.float32)
+        self._terminal_metrics = self._target_metrics * np.float32(0.95)
 
     def reset(
         self, seed: Optional[int] = None, options: Optional[Dict] = None
@@ -47,10 +130,11 @@ class RLIEnvironment(gym.Env):
         """
         super().reset(seed=seed)
 
-        self.current_metrics = np.array([0.5, 0.5, 0.5, 0.5, 0.5])
+        self.current_metrics.fill(0.5)
+        observation = self.current_metrics.astype(self._obs_dtype)
         info = {"metrics": self.current_metrics.copy()}
 
-        return self.current_metrics.astype(np.float32), info
+        return observation, info
 
     def step(self, action: np.ndarray) -> Tuple[np.ndarray, float, bool, bool, Dict]:
         """
@@ -62,28 +146,54 @@ class RLIEnvironment(gym.Env):
         Returns:
             관찰, 보상, 종료 여부, 잘림 여부, 정보 딕셔너리
         """
-        # 액션을 메트릭 조정에 적용
-        self.current_metrics = np.clip(
-            self.current_metrics + action * 0.1, 0.0, 1.0
-        )
+        if NUMBA_AVAILABLE:
+            reward, terminated = _step_kernel(
+                self.current_metrics,
+                np.asarray(action),
+                self._target_metrics,
+                self._terminal_metrics,
+            )
+            reward = float(reward)
+            terminated = bool(terminated)
+        else:
+            reward, terminated = self._step_numpy(action)
 
-        # 보상 계산 (타겟과의 거리 기반)
-        reward = -np.mean(np.abs(self.current_metrics - self.target_metrics))
-
-        # 종료 조건: 모든 메트릭이 타겟에 도달
-        terminated = np.all(self.current_metrics >= self.target_metrics * 0.95)
         truncated = False
 
+        # 호출자가 관찰을 보관할 수 있도록 스텝마다 새 배열로 반환
         info = {
             "metrics": self.current_metrics.copy(),
-            "reward": float(reward),
+            "reward": reward,
         }
 
         return (
-            self.current_metrics.astype(np.float32),
-            float(reward),
+            self.current_metrics.astype(self._obs_dtype),
+            reward,
             terminated,
             truncated,
             info,
         )
 
+    def _step_numpy(self, action: np.ndarray) -> Tuple[float, bool]:
+        """
+        Numba가 없을 때 사용하는 NumPy 스텝 연산
+
+        Args:
+            action: 에이전트 액션
+
+        Returns:
+            보상과 종료 여부
+        """
+        # 액션을 메트릭 조정에 적용 (버퍼에서 제자리 연산)
+        np.multiply(action, 0.1, out=self._work)
+        np.add(self.current_metrics, self._work, out=self._work)
+        np.clip(self._work, 0.0, 1.0, out=self.current_metrics)
+
+        # 보상 계산 (타겟과의 거리 기반)
+        np.subtract(self.current_metrics, self._target_metrics, out=self._work)
+        np.abs(self._work, out=self._work)
+        reward = -float(self._work.mean())
+
+        # 종료 조건: 모든 메트릭이 타겟에 도달
+        terminated = bool((self.current_metrics >= self._terminal_metrics).all())
+        return reward, terminated
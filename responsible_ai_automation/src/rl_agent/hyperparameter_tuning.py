@@ -3,7 +3,10 @@
 """
 
 from typing import Dict, Any, Optional, Callable
+import functools
+import inspect
 import logging
+import uuid
 
 try:
     import optuna
@@ -13,6 +16,7 @@ except ImportError:
 
 try:
     from ray import tune
+    from ray.tune.schedulers import PopulationBasedTraining
     RAY_TUNE_AVAILABLE = True
 except ImportError:
     RAY_TUNE_AVAILABLE = False
@@ -31,6 +35,23 @@ class HyperparameterTuner:
         self.n_trials = self.config.get("n_trials", 100)
         self.logger = logging.getLogger(__name__)
 
+    def _create_optuna_storage(self) -> Optional[Any]:
+        """
+        Optuna 스토리지 생성
+
+        ``journal_file`` 설정이 있으면 파일 기반 JournalStorage를(공유 파일시스템에서
+        SQLite보다 쓰기 잠금 경합이 적음), ``storage`` 설정이 있으면 해당 RDB URL을 사용합니다.
+        둘 다 없으면 None(메모리 내 스토리지)을 반환합니다.
+
+        Returns:
+            Optuna 스토리지 또는 None
+        """
+        journal_file = self.config.get("journal_file")
+        if journal_file:
+            from optuna.storages.journal import JournalFileBackend, JournalStorage
+            return JournalStorage(JournalFileBackend(journal_file))
+        return self.config.get("storage")
+
     def tune_with_optuna(
         self,
         objective_func: Callable,
@@ -41,48 +62,96 @@ class HyperparameterTuner:
         Optuna를 사용한 하이퍼파라미터 튜닝
 
         Args:
-            objective_func: 목적 함수
+            objective_func: 목적 함수. ``trial`` 인자를 받으면 Optuna trial이 함께 전달되어
+                ``trial.report(value, step)``와 ``trial.should_prune()``로 조기 중단할 수 있음
             search_space: 검색 공간 정의
             direction: 최적화 방향 ("maximize" 또는 "minimize")
 
         Returns:
             최적 하이퍼파라미터 또는 None
+
+        Note:
+            ``n_jobs`` > 1이면 같은 프로세스의 스레드에서 trial이 동시에 실행되므로
+            objective_func는 스레드 안전해야 합니다. ``storage``/``journal_file``과
+            ``study_name``을 지정하면 여러 프로세스나 머신에서 같은 study를 나누어 실행할 수 있습니다.
         """
         if not OPTUNA_AVAILABLE:
             self.logger.error("Optuna가 설치되지 않았습니다. pip install optuna를 실행하세요.")
             return None
 
+        # trial을 받는 목적 함수에만 전달 (기존 objective_func(params) 형태와 호환)
+        try:
+            pass_trial = "trial" in inspect.signature(objective_func).parameters
+        except (TypeError, ValueError):
+            pass_trial = False
+
+        # 검색 공간을 trial마다 해석하지 않도록 파라미터별 샘플러를 미리 생성
+        samplers = []
+        for param_name, param_config in search_space.items():
+            param_type = param_config.get("type", "float")
+
+            if param_type == "float":
+                sampler = functools.partial(
+                    optuna.Trial.suggest_float,
+                    name=param_name,
+                    low=param_config.get("low", 0.0),
+                    high=param_config.get("high", 1.0),
+                    log=param_config.get("log", False)
+                )
+            elif param_type == "int":
+                sampler = functools.partial(
+                    optuna.Trial.suggest_int,
+                    name=param_name,
+                    low=param_config.get("low", 1),
+                    high=param_config.get("high", 100),
+                    log=param_config.get("log", False)
+                )
+            elif param_type == "categorical":
+                sampler = functools.partial(
+                    optuna.Trial.suggest_categorical,
+                    name=param_name,
+                    choices=param_config.get("choices", [])
+                )
+            else:
+                continue
+            samplers.append((param_name, sampler))
+
         def objective(trial):
             # 검색 공간에서 하이퍼파라미터 샘플링
-            params = {}
-            for param_name, param_config in search_space.items():
-                param_type = param_config.get("type", "float")
-                
-                if param_type == "float":
-                    params[param_name] = trial.suggest_float(
-                        param_name,
-                        param_config.get("low", 0.0),
-                        param_config.get("high", 1.0),
-                        log=param_config.get("log", False)
-                    )
-                elif param_type == "int":
-                    params[param_name] = trial.suggest_int(
-                        param_name,
-                        param_config.get("low", 1),
-                        param_config.get("high", 100),
-                        log=param_config.get("log", False)
-                    )
-                elif param_type == "categorical":
-                    params[param_name] = trial.suggest_categorical(
-                        param_name,
-                        param_config.get("choices", [])
-                    )
+            params = {param_name: sampler(trial) for param_name, sampler in samplers}
 
             # 목적 함수 실행
+            if pass_trial:
+                return objective_func(params, trial=trial)
             return objective_func(params)
 
-        study = optuna.create_study(direction=direction)
-        study.optimize(objective, n_trials=self.n_trials)
+        # 가망 없는 trial은 중간 보고값 기준으로 조기 중단
+        pruner = optuna.pruners.HyperbandPruner(
+            min_resource=1,
+            max_resource=self.config.get("max_resource", 81),
+            reduction_factor=3
+        )
+        sampler = optuna.samplers.TPESampler(multivariate=True, group=True)
+
+        storage = self._create_optuna_storage()
+        study_name = self.config.get("study_name")
+        if storage is not None and study_name is None:
+            study_name = f"rai_{uuid.uuid4().hex[:8]}"
+
+        study = optuna.create_study(
+            storage=storage,
+            study_name=study_name,
+            load_if_exists=storage is not None,
+            direction=direction,
+            pruner=pruner,
+            sampler=sampler
+        )
+        study.optimize(
+            objective,
+            n_trials=self.n_trials,
+            n_jobs=self.config.get("n_jobs", 1),
+            gc_after_trial=False
+        )
 
         best_params = study.best_params
         best_value = study.best_value
@@ -106,7 +175,10 @@ class HyperparameterTuner:
         Ray Tune을 사용한 하이퍼파라미터 튜닝
 
         Args:
-            objective_func: 목적 함수
+            objective_func: 목적 함수. ``iteration`` 인자를 받으면 반복마다 현재 반복 번호와
+                함께 호출되어 이어서 학습한 결과를 보고하는 것으로 간주하고, 여러 반복에 걸친
+                Population-Based Training을 사용함. 받지 않으면 한 번만 실행하는 목적 함수로
+                보고 샘플마다 한 번만 실행함
             search_space: 검색 공간 정의
             num_samples: 샘플 수 (None이면 n_trials 사용)
 
@@ -120,8 +192,17 @@ class HyperparameterTuner:
         if num_samples is None:
             num_samples = self.n_trials
 
+        # 반복 번호를 받는 목적 함수만 여러 반복 실행 (상태가 없는 목적 함수를 반복하면
+        # 같은 계산을 되풀이할 뿐 새로운 정보가 없음)
+        try:
+            iterative = "iteration" in inspect.signature(objective_func).parameters
+        except (TypeError, ValueError):
+            iterative = False
+        max_iterations = self.config.get("max_training_iterations", 20) if iterative else 1
+
         # Ray Tune 검색 공간 변환
         ray_search_space = {}
+        hyperparam_mutations = {}
         for param_name, param_config in search_space.items():
             param_type = param_config.get("type", "float")
             
@@ -130,6 +211,7 @@ class HyperparameterTuner:
                     param_config.get("low", 0.0),
                     param_config.get("high", 1.0)
                 )
+                hyperparam_mutations[param_name] = ray_search_space[param_name]
             elif param_type == "int":
                 ray_search_space[param_name] = tune.randint(
                     param_config.get("low", 1),
@@ -140,13 +222,60 @@ class HyperparameterTuner:
                     param_config.get("choices", [])
                 )
 
-        def trainable(config):
-            return objective_func(config)
+        class ObjectiveTrainable(tune.Trainable):
+            """
+            PBT가 개체를 교체할 수 있도록 목적 함수를 감싼 Trainable
+
+            step마다 목적 함수를 현재 config로 한 번 실행하며 (반복 가능한 목적 함수에는
+            반복 번호도 전달), 체크포인트에는 반복 횟수와 최근 점수만 저장합니다.
+            """
+
+            def setup(self, config):
+                self.iteration = 0
+                self.last_score = None
+
+            def step(self):
+                if iterative:
+                    result = objective_func(self.config, iteration=self.iteration)
+                else:
+                    result = objective_func(self.config)
+                if not isinstance(result, dict):
+                    result = {"score": result}
+                self.iteration += 1
+                self.last_score = result.get("score")
+                return result
+
+            def save_checkpoint(self, checkpoint_dir):
+                return {"iteration": self.iteration, "last_score": self.last_score}
+
+            def load_checkpoint(self, checkpoint):
+                self.iteration = checkpoint["iteration"]
+                self.last_score = checkpoint["last_score"]
+
+            def reset_config(self, new_config):
+                self.config = new_config
+                return True
+
+        # Population-Based Training: 주기적으로 상위 개체의 하이퍼파라미터를 이어받아 탐색
+        # (반복 가능한 목적 함수가 아니거나 변이 가능한 float 파라미터가 없으면 스케줄러 없이 실행)
+        scheduler = None
+        if iterative and hyperparam_mutations:
+            scheduler = PopulationBasedTraining(
+                time_attr="training_iteration",
+                metric="score",
+                mode="max",
+                perturbation_interval=self.config.get("perturbation_interval", 4),
+                hyperparam_mutations=hyperparam_mutations,
+                resample_probability=0.25
+            )
 
         analysis = tune.run(
-            trainable,
+            ObjectiveTrainable,
             config=ray_search_space,
             num_samples=num_samples,
+            scheduler=scheduler,
+            stop={"training_iteration": max_iterations},
+            reuse_actors=True,
             metric="score",
             mode="max"
         )
@@ -2,13 +2,22 @@
 보상 계산 모듈
 """
 
-import numpy as np
 from typing import Dict, Any, Optional
 
 
 class RewardCalculator:
     """보상 계산 클래스"""
 
+    # 각 카테고리별 임계값 (충족 시 THRESHOLD_BONUS 추가 보상)
+    THRESHOLDS = {
+        "fairness": 0.7,
+        "transparency": 0.7,
+        "accountability": 0.7,
+        "privacy": 0.8,
+        "robustness": 0.75,
+    }
+    THRESHOLD_BONUS = 0.1
+
     def __init__(self, config: Dict[str, Any]):
         """
         Args:
@@ -16,6 +25,13 @@ class RewardCalculator:
         """
         self.config = config
 
+        # 카테고리 5개뿐이므로 배열/커널 호출 비용이 연산보다 커서 스칼라 루프로 처리
+        # (호출마다 점수 키 문자열을 만들지 않도록 미리 계산)
+        self._threshold_items = tuple(
+            (category, f"overall_{category}_score", threshold)
+            for category, threshold in self.THRESHOLDS.items()
+        )
+
     def calculate_reward(
         self, metrics: Dict[str, Any], previous_metrics: Optional[Dict[str, Any]] = None
     ) -> float:
@@ -29,34 +45,19 @@ class RewardCalculator:
         Returns:
             보상 값
         """
-        # 전체 Responsible AI 점수 기반 보상
+        # 기본 보상: 전체 Responsible AI 점수가 높을수록 높은 보상
         overall_score = metrics.get("overall_responsible_ai_score", 0.0)
-
-        # 기본 보상: 점수가 높을수록 높은 보상
         reward = overall_score
 
         # 개선 보상: 이전 대비 개선 시 추가 보상
         if previous_metrics is not None:
             previous_score = previous_metrics.get("overall_responsible_ai_score", 0.0)
-            improvement = overall_score - previous_score
-            reward += improvement * 2.0  # 개선에 대한 추가 보상
+            reward += (overall_score - previous_score) * 2.0
 
         # 각 카테고리별 임계값 충족 보상
-        thresholds = {
-            "fairness": 0.7,
-            "transparency": 0.7,
-            "accountability": 0.7,
-            "privacy": 0.8,
-            "robustness": 0.75,
-        }
-
-        for category, threshold in thresholds.items():
-            if category in metrics:
-                category_score = metrics[category].get(
-                    f"overall_{category}_score", 0.0
-                )
-                if category_score >= threshold:
-                    reward += 0.1  # 임계값 충족 시 추가 보상
-
-        return float(reward)
+        met = 0
+        for category, score_key, threshold in self._threshold_items:
+            if category in metrics and metrics[category].get(score_key, 0.0) >= threshold:
+                met += 1
 
+        return float(reward + self.THRESHOLD_BONUS * met)
@@ -6,22 +6,73 @@ import numpy as np
 import pandas as pd
 from typing import Dict, Any, List, Optional, Callable, Iterator
 from functools import wraps
+import os
 import time
 import logging
 
 
+def _process_shared_batch(
+    shm_name: str,
+    shape: tuple,
+    dtype: str,
+    start: int,
+    end: int,
+    process_func: Callable,
+    args: tuple,
+    kwargs: Dict[str, Any]
+) -> Any:
+    """
+    공유 메모리에 올라간 배열의 [start:end] 구간을 워커에서 처리
+
+    배열 자체는 전달하지 않고 공유 메모리 이름과 구간만 전달받아 로컬 뷰를 구성합니다.
+    """
+    from multiprocessing import shared_memory
+
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        view = np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+        batch = view[start:end]
+        result = process_func(batch, *args, **kwargs)
+        # 공유 메모리를 닫기 전에 버퍼를 참조하는 결과는 복사
+        if isinstance(result, np.ndarray) and np.may_share_memory(result, view):
+            result = result.copy()
+        del batch, view
+        return result
+    finally:
+        shm.close()
+
+
 class BatchProcessor:
     """배치 처리 클래스"""
 
-    def __init__(self, batch_size: int = 1000, max_workers: Optional[int] = None):
+    # 인스턴스마다 조회하지 않고 모든 BatchProcessor가 공유
+    logger = logging.getLogger(__name__)
+
+    def __init__(
+        self,
+        batch_size: int = 1000,
+        max_workers: Optional[int] = None,
+        use_threads: bool = False,
+        use_shared_memory: bool = False
+    ):
         """
         Args:
             batch_size: 배치 크기
-            max_workers: 최대 워커 수 (None이면 CPU 코어 수)
+            max_workers: 최대 워커 수 (None이면 이 프로세스가 사용할 수 있는 CPU 코어 수)
+            use_threads: 스레드 풀로 병렬 처리 (GIL을 해제하는 NumPy 연산에 적합, 배치 직렬화 없음)
+            use_shared_memory: 프로세스 풀 사용 시 배열을 공유 메모리로 한 번만 복사하고
+                워커에는 구간 인덱스만 전달
         """
         self.batch_size = batch_size
+        if max_workers is None:
+            # cpu_count()와 달리 taskset/cgroup으로 제한된 CPU 집합을 반영
+            try:
+                max_workers = len(os.sched_getaffinity(0))
+            except AttributeError:
+                max_workers = os.cpu_count() or 1
         self.max_workers = max_workers
-        self.logger = logging.getLogger(__name__)
+        self.use_threads = use_threads
+        self.use_shared_memory = use_shared_memory
 
     def process_in_batches(
         self,
@@ -42,20 +93,22 @@ class BatchProcessor:
         Returns:
             처리 결과 리스트
         """
-        results = []
-        total_batches = (len(data) + self.batch_size - 1) // self.batch_size
+        batch_size = self.batch_size
+        starts = range(0, len(data), batch_size)
+        total_batches = len(starts)
+        results: List[Any] = [None] * total_batches
+        debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
 
-        for i in range(0, len(data), self.batch_size):
-            batch = data[i:i + self.batch_size]
-            batch_num = i // self.batch_size + 1
+        for batch_idx, start in enumerate(starts):
+            batch = data[start:start + batch_size]
 
-            self.logger.debug(f"배치 {batch_num}/{total_batches} 처리 중...")
+            if debug_enabled:
+                self.logger.debug("배치 %d/%d 처리 중...", batch_idx + 1, total_batches)
 
             try:
-                result = process_func(batch, *args, **kwargs)
-                results.append(result)
+                results[batch_idx] = process_func(batch, *args, **kwargs)
             except Exception as e:
-                self.logger.error(f"배치 {batch_num} 처리 중 오류 발생: {e}")
+                self.logger.error("배치 %d 처리 중 오류 발생: %s", batch_idx + 1, e)
                 raise
 
         return results
@@ -80,39 +133,65 @@ class BatchProcessor:
             처리 결과 리스트
         """
         try:
-            from concurrent.futures import ProcessPoolExecutor, as_completed
-            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 
-            if self.max_workers is None:
-                max_workers = multiprocessing.cpu_count()
-            else:
-                max_workers = self.max_workers
+            max_workers = self.max_workers
 
-            # 데이터를 배치로 나누기
-            batches = [
-                data[i:i + self.batch_size]
+            bounds = [
+                (i, min(i + self.batch_size, len(data)))
                 for i in range(0, len(data), self.batch_size)
             ]
 
-            results = []
-            with ProcessPoolExecutor(max_workers=max_workers) as executor:
-                futures = {
-                    executor.submit(process_func, batch, *args, **kwargs): i
-                    for i, batch in enumerate(batches)
-                }
-
-                for future in as_completed(futures):
-                    batch_idx = futures[future]
-                    try:
-                        result = future.result()
-                        results.append((batch_idx, result))
-                    except Exception as e:
-                        self.logger.error(f"배치 {batch_idx} 처리 중 오류 발생: {e}")
-                        raise
-
-            # 결과를 원래 순서로 정렬
-            results.sort(key=lambda x: x[0])
-            return [result for _, result in results]
+            # 배치 인덱스 자리에 바로 기록하여 완료 후 정렬이 필요 없도록 함
+            results: List[Any] = [None] * len(bounds)
+            shm = None
+            try:
+                if self.use_threads:
+                    # 스레드는 메모리를 공유하므로 슬라이스 뷰를 그대로 전달 (pickling 없음)
+                    executor = ThreadPoolExecutor(max_workers=max_workers)
+                    calls = [
+                        (process_func, (data[start:end], *args), kwargs)
+                        for start, end in bounds
+                    ]
+                elif self.use_shared_memory and isinstance(data, np.ndarray) and data.dtype != object:
+                    from multiprocessing import shared_memory
+
+                    # 배열을 공유 메모리에 한 번만 복사하고 워커에는 이름과 구간만 전달
+                    shm = shared_memory.SharedMemory(create=True, size=max(data.nbytes, 1))
+                    np.ndarray(data.shape, dtype=data.dtype, buffer=shm.buf)[:] = data
+                    executor = ProcessPoolExecutor(max_workers=max_workers)
+                    calls = [
+                        (_process_shared_batch,
+                         (shm.name, data.shape, data.dtype.str, start, end, process_func, args, kwargs),
+                         {})
+                        for start, end in bounds
+                    ]
+                else:
+                    executor = ProcessPoolExecutor(max_workers=max_workers)
+                    calls = [
+                        (process_func, (data[start:end], *args), kwargs)
+                        for start, end in bounds
+                    ]
+
+                with executor:
+                    futures = {
+                        executor.submit(func, *func_args, **func_kwargs): i
+                        for i, (func, func_args, func_kwargs) in enumerate(calls)
+                    }
+
+                    for future in as_completed(futures):
+                        batch_idx = futures[future]
+                        try:
+                            results[batch_idx] = future.result()
+                        except Exception as e:
+                            self.logger.error("배치 %d 처리 중 오류 발생: %s", batch_idx, e, exc_info=True)
+                            raise
+            finally:
+                if shm is not None:
+                    shm.close()
+                    shm.unlink()
+
+            return results
 
         except ImportError:
             self.logger.warning("병렬 처리를 사용할 수 없습니다. 순차 처리로 전환합니다.")
@@ -132,13 +211,39 @@ class BatchProcessor:
 
         Yields:
             데이터프레임 청크
+
+        Note:
+            모든 컬럼이 같은 수치형이고 하위 처리에 배열만 필요하다면
+            ``chunk_ndarray(df.to_numpy(), chunk_size)``가 청크당 오버헤드가 훨씬 적습니다.
         """
         if chunk_size is None:
             chunk_size = self.batch_size
 
-        for i in range(0, len(df), chunk_size):
+        n_rows = len(df)
+        for i in range(0, n_rows, chunk_size):
             yield df.iloc[i:i + chunk_size]
 
+    def chunk_ndarray(
+        self,
+        arr: np.ndarray,
+        chunk_size: Optional[int] = None
+    ) -> Iterator[np.ndarray]:
+        """
+        배열을 청크로 나누기 (복사 없이 뷰 슬라이싱)
+
+        Args:
+            arr: 배열
+            chunk_size: 청크 크기 (None이면 batch_size 사용)
+
+        Yields:
+            배열 청크 (원본 배열의 뷰)
+        """
+        if chunk_size is None:
+            chunk_size = self.batch_size
+
+        for i in range(0, len(arr), chunk_size):
+            yield arr[i:i + chunk_size]
+
 
 def batch_process_decorator(batch_size: int = 1000):
     """
@@ -151,9 +256,10 @@ def batch_process_decorator(batch_size: int = 1000):
         데코레이터 함수
     """
     def decorator(func: Callable) -> Callable:
+        processor = BatchProcessor(batch_size=batch_size)
+
         @wraps(func)
         def wrapper(data: np.ndarray, *args, **kwargs):
-            processor = BatchProcessor(batch_size=batch_size)
             return processor.process_in_batches(data, func, *args, **kwargs)
         return wrapper
     return decorator
@@ -171,9 +277,10 @@ def parallel_process_decorator(batch_size: int = 1000, max_workers: Optional[int
         데코레이터 함수
     """
     def decorator(func: Callable) -> Callable:
+        processor = BatchProcessor(batch_size=batch_size, max_workers=max_workers)
+
         @wraps(func)
         def wrapper(data: np.ndarray, *args, **kwargs):
-            processor = BatchProcessor(batch_size=batch_size, max_workers=max_workers)
             return processor.process_parallel(data, func, *args, **kwargs)
         return wrapper
     return decorator
@@ -3,7 +3,6 @@
 """
 
 import logging
-import traceback
 from typing import Optional, Callable, Any
 from functools import wraps
 
@@ -38,10 +37,11 @@ class ErrorHandler:
                 return func(*args, **kwargs)
             except Exception as e:
                 if log_error:
+                    # 메시지와 트레이스백 포맷팅은 핸들러가 실제로 출력할 때만 수행됨
                     logger.error(
-                        f"함수 {func.__name__} 실행 중 오류 발생: {e}\n"
-                        f"인자: args={args}, kwargs={kwargs}\n"
-                        f"트레이스백:\n{traceback.format_exc()}"
+                        "함수 %s 실행 중 오류 발생: %s\n인자: args=%r, kwargs=%r",
+                        func.__name__, e, args, kwargs,
+                        exc_info=True
                     )
 
                 if reraise:
@@ -79,6 +79,10 @@ class ErrorHandler:
                 return None
             raise ValueError(f"{name}은(는) None일 수 없습니다.")
 
+        # 정확히 같은 타입인 경우가 대부분이므로 isinstance(MRO 탐색) 전에 먼저 확인
+        if type(value) is expected_type:
+            return value
+
         if not isinstance(value, expected_type):
             raise TypeError(
                 f"{name}은(는) {expected_type.__name__} 타입이어야 합니다. "
@@ -109,6 +113,6 @@ class ErrorHandler:
         try:
             return func(*args, **kwargs)
         except Exception as e:
-            logger.error(f"함수 실행 중 오류 발생: {e}")
+            logger.error("함수 실행 중 오류 발생: %s", e)
             return default_return
 
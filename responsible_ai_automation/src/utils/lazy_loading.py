@@ -2,10 +2,14 @@
 지연 로딩 유틸리티 - 빠른 초기화를 위한 모듈
 """
 
-from typing import Any, Callable, Optional
+from typing import Any, Callable
 import functools
 
 
+# 아직 로드되지 않았음을 나타내는 센티널 (None도 유효한 로드 결과일 수 있음)
+_MISSING = object()
+
+
 class LazyLoader:
     """지연 로딩 클래스"""
     
@@ -19,25 +23,28 @@ class LazyLoader:
         self._loader_func = loader_func
         self._args = args
         self._kwargs = kwargs
-        self._loaded_value: Optional[Any] = None
-        self._is_loaded = False
+        self._value: Any = _MISSING
     
     def __call__(self) -> Any:
         """값 로드"""
-        if not self._is_loaded:
-            self._loaded_value = self._loader_func(*self._args, **self._kwargs)
-            self._is_loaded = True
-        return self._loaded_value
+        value = self._value
+        if value is _MISSING:
+            return self._load()
+        return value
+    
+    def _load(self) -> Any:
+        """로더 함수를 실행하고 결과 저장"""
+        self._value = self._loader_func(*self._args, **self._kwargs)
+        return self._value
     
     @property
     def value(self) -> Any:
         """값 속성"""
-        return self.__call__()
+        return self()
     
     def reset(self):
         """로드된 값 초기화"""
-        self._loaded_value = None
-        self._is_loaded = False
+        self._value = _MISSING
 
 
 def lazy_property(func: Callable) -> property:
@@ -55,9 +62,12 @@ def lazy_property(func: Callable) -> property:
     @property
     @functools.wraps(func)
     def wrapper(self):
-        if not hasattr(self, attr_name):
-            setattr(self, attr_name, func(self))
-        return getattr(self, attr_name)
+        try:
+            return object.__getattribute__(self, attr_name)
+        except AttributeError:
+            value = func(self)
+            setattr(self, attr_name, value)
+            return value
     
     return wrapper
 
@@ -6,7 +6,53 @@ import logging
 import sys
 from pathlib import Path
 from logging.handlers import RotatingFileHandler
-from typing import Optional
+from typing import Any, Optional
+
+
+class LazyRotatingHandler(logging.Handler):
+    """
+    첫 로그 레코드가 들어올 때 파일과 RotatingFileHandler를 만드는 핸들러
+
+    로그를 한 줄도 남기지 않는 짧은 실행에서는 디렉터리 생성과 파일 열기를 하지 않습니다.
+    """
+
+    def __init__(self, filename: str, **kwargs: Any):
+        """
+        Args:
+            filename: 로그 파일 경로
+            **kwargs: RotatingFileHandler에 전달할 키워드 인자
+        """
+        super().__init__()
+        self._filename = filename
+        self._kwargs = kwargs
+        self._inner: Optional[RotatingFileHandler] = None
+
+    def emit(self, record: logging.LogRecord):
+        """레코드 기록 (처음 호출될 때 실제 파일 핸들러 생성)"""
+        # handle()이 self.lock을 잡은 상태에서 호출되므로 생성은 한 번만 일어남
+        # 파일을 열 수 없어도 호출한 코드로 예외가 전파되지 않도록 handleError로 처리
+        try:
+            if self._inner is None:
+                Path(self._filename).parent.mkdir(parents=True, exist_ok=True)
+                self._inner = RotatingFileHandler(self._filename, **self._kwargs)
+                self._inner.setFormatter(self.formatter)
+            self._inner.emit(record)
+        except Exception:
+            self.handleError(record)
+
+    def setFormatter(self, fmt: Optional[logging.Formatter]):
+        super().setFormatter(fmt)
+        if self._inner is not None:
+            self._inner.setFormatter(fmt)
+
+    def flush(self):
+        if self._inner is not None:
+            self._inner.flush()
+
+    def close(self):
+        if self._inner is not None:
+            self._inner.close()
+        super().close()
 
 
 def setup_logging(
@@ -52,11 +98,9 @@ def setup_logging(
     logger.addHandler(console_handler)
 
     # 파일 핸들러 (지정된 경우)
+    # 파일은 첫 로그가 기록될 때 생성
     if log_file:
-        log_path = Path(log_file)
-        log_path.parent.mkdir(parents=True, exist_ok=True)
-
-        file_handler = RotatingFileHandler(
+        file_handler = LazyRotatingHandler(
             log_file,
             maxBytes=max_bytes,
             backupCount=backup_count,
@@ -4,11 +4,53 @@
 
 import mlflow
 import mlflow.sklearn
-from typing import Dict, Any, Optional
+from mlflow.entities import Metric, RunTag
+from mlflow.tracking import MlflowClient
+from typing import Dict, Any, List, Optional
+from dataclasses import dataclass, field
 from pathlib import Path
+from functools import lru_cache
 import json
+import time
 from datetime import datetime
 
+try:
+    # MLflow 내부 API이므로 버전에 따라 없을 수 있음
+    from mlflow.utils.autologging_utils.client import MlflowAutologgingQueueingClient
+    QUEUEING_CLIENT_AVAILABLE = True
+except ImportError:
+    QUEUEING_CLIENT_AVAILABLE = False
+
+
+@lru_cache(maxsize=None)
+def _resolve_experiment_id(tracking_uri: str, experiment_name: str) -> str:
+    """
+    실험 ID 조회 (없으면 생성)
+
+    추적 서버 조회는 (tracking_uri, experiment_name) 조합마다 한 번만 수행됩니다.
+
+    Args:
+        tracking_uri: MLflow 추적 URI
+        experiment_name: 실험 이름
+
+    Returns:
+        실험 ID
+    """
+    client = MlflowClient(tracking_uri=tracking_uri)
+    experiment = client.get_experiment_by_name(experiment_name)
+    if experiment is not None:
+        return experiment.experiment_id
+    return client.create_experiment(experiment_name)
+
+
+@dataclass
+class RegistryRunSpec:
+    """모델 등록 요청 (register_model 인자와 동일)"""
+    model: Any
+    metrics: Dict[str, Any]
+    model_name: str = "responsible_ai_model"
+    tags: Dict[str, str] = field(default_factory=dict)
+
 
 class ModelRegistry:
     """모델 버전 관리 클래스"""
@@ -19,9 +61,19 @@ class ModelRegistry:
             config: 설정 딕셔너리
         """
         self.config = config
-        mlflow.set_tracking_uri(config.get("mlflow", {}).get("tracking_uri", "file:./mlruns"))
-        self.experiment_name = config.get("mlflow", {}).get("experiment_name", "responsible_ai")
-        mlflow.set_experiment(self.experiment_name)
+        mlflow_config = config.get("mlflow", {})
+        self.tracking_uri = mlflow_config.get("tracking_uri", "file:./mlruns")
+        self.experiment_name = mlflow_config.get("experiment_name", "responsible_ai")
+        # mlflow.sklearn.log_model에 그대로 전달 ("cloudpickle"은 MLflow 기본값, "pickle" 선택 가능)
+        self.serialization_format = mlflow_config.get("serialization_format", "cloudpickle")
+
+        # URI 설정은 로컬 상태만 바꾸므로 매번 적용하고, 서버 조회가 필요한 실험 ID만 캐시
+        if mlflow.get_tracking_uri() != self.tracking_uri:
+            mlflow.set_tracking_uri(self.tracking_uri)
+        self.experiment_id = _resolve_experiment_id(self.tracking_uri, self.experiment_name)
+
+        # 추적 클라이언트는 처음 등록할 때 만들고 이후 등록에서 재사용 (HTTP/DB 세션 공유)
+        self._client: Optional[Any] = None
 
     def register_model(
         self,
@@ -42,36 +94,95 @@ class ModelRegistry:
         Returns:
             모델 버전
         """
-        with mlflow.start_run():
-            # 메트릭 로깅
-            mlflow.log_metric("overall_responsible_ai_score", metrics.get("overall_responsible_ai_score", 0.0))
-            mlflow.log_metric("is_responsible", 1.0 if metrics.get("is_responsible", False) else 0.0)
-            
+        return self._flush_spec(RegistryRunSpec(model, metrics, model_name, dict(tags or {})))
+
+    def register_many(self, specs: List[RegistryRunSpec]) -> List[str]:
+        """
+        여러 모델을 같은 추적 클라이언트로 연속 등록
+
+        Args:
+            specs: 모델 등록 요청 리스트
+
+        Returns:
+            요청 순서대로의 모델 버전 리스트
+        """
+        return [self._flush_spec(spec) for spec in specs]
+
+    def _get_client(self) -> Any:
+        """공유 추적 클라이언트 (큐잉 클라이언트를 쓸 수 있으면 큐잉 클라이언트)"""
+        if self._client is None:
+            if QUEUEING_CLIENT_AVAILABLE:
+                self._client = MlflowAutologgingQueueingClient(tracking_uri=self.tracking_uri)
+            else:
+                self._client = MlflowClient(tracking_uri=self.tracking_uri)
+        return self._client
+
+    def _flush_spec(self, spec: RegistryRunSpec) -> str:
+        """
+        등록 요청 하나를 하나의 run으로 기록하고 모델 등록
+
+        Args:
+            spec: 모델 등록 요청
+
+        Returns:
+            모델 버전
+        """
+        metrics = spec.metrics
+        with mlflow.start_run(experiment_id=self.experiment_id) as run:
+            # 메트릭과 태그를 모아 한 번에 전송 (호출마다 왕복하지 않도록)
+            overall_score = metrics.get("overall_responsible_ai_score", 0.0)
+            batch_metrics = {
+                "overall_responsible_ai_score": float(overall_score),
+                "is_responsible": 1.0 if metrics.get("is_responsible", False) else 0.0,
+            }
+
             for category in ["fairness", "transparency", "accountability", "privacy", "robustness"]:
                 if category in metrics:
                     score_key = f"overall_{category}_score"
                     score = metrics[category].get(score_key, 0.0)
-                    mlflow.log_metric(f"{category}_score", score)
+                    batch_metrics[f"{category}_score"] = float(score)
 
             # 태그 추가
-            if tags:
-                mlflow.set_tags(tags)
-            
+            batch_tags = {key: str(value) for key, value in spec.tags.items()}
+
             # Responsible AI 점수 기반 자동 태깅
-            overall_score = metrics.get("overall_responsible_ai_score", 0.0)
             if overall_score >= 0.9:
-                mlflow.set_tag("quality", "excellent")
+                batch_tags["quality"] = "excellent"
             elif overall_score >= 0.75:
-                mlflow.set_tag("quality", "good")
+                batch_tags["quality"] = "good"
             else:
-                mlflow.set_tag("quality", "needs_improvement")
+                batch_tags["quality"] = "needs_improvement"
+
+            run_id = run.info.run_id
+            client = self._get_client()
+            # 비동기 flush를 지원하는 클라이언트(큐잉 클라이언트)인지 실제 기능으로 판단
+            if callable(getattr(client, "flush", None)):
+                # 메트릭/태그 전송을 백그라운드로 보내고 모델 저장과 겹쳐서 실행
+                client.log_metrics(run_id, batch_metrics)
+                client.set_tags(run_id, batch_tags)
+                pending = client.flush(synchronous=False)
+            else:
+                timestamp = int(time.time() * 1000)
+                client.log_batch(
+                    run_id,
+                    metrics=[
+                        Metric(key, value, timestamp, 0) for key, value in batch_metrics.items()
+                    ],
+                    tags=[RunTag(key, value) for key, value in batch_tags.items()]
+                )
+                pending = None
 
             # 모델 저장
-            mlflow.sklearn.log_model(model, "model")
+            mlflow.sklearn.log_model(
+                spec.model, "model", serialization_format=self.serialization_format
+            )
+
+            if pending is not None:
+                pending.await_completion()
             
             # 모델 등록
-            model_uri = f"runs:/{mlflow.active_run().info.run_id}/model"
-            mv = mlflow.register_model(model_uri, model_name)
+            model_uri = f"runs:/{run_id}/model"
+            mv = mlflow.register_model(model_uri, spec.model_name)
             
             return mv.version
 
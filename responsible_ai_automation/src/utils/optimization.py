@@ -6,9 +6,20 @@ import os
 from typing import Dict, Any, Optional
 import numpy as np
 
+# dtype을 바꾸며 샘플링할 때 한 번에 모으는 바이트 수 (임시 버퍼 크기 상한)
+_GATHER_BLOCK_BYTES = 1 << 20
+
 
 class OptimizationConfig:
     """최적화 설정 클래스"""
+
+    __slots__ = (
+        "use_parallel", "n_jobs", "cache_enabled", "cache_size", "sample_size",
+        "random_state", "streaming", "_parallel_threshold", "_abs_sample", "_frac_sample",
+    )
+
+    # 작은 데이터는 병렬 처리 오버헤드가 더 큼
+    PARALLEL_MIN_SIZE = 1000
     
     def __init__(self, config: Dict[str, Any]):
         """
@@ -22,6 +33,7 @@ class OptimizationConfig:
         self.cache_enabled = perf_config.get("cache_enabled", True)
         self.cache_size = perf_config.get("cache_size", 100)
         self.sample_size = perf_config.get("sample_size")
+        self.random_state = perf_config.get("random_state")
         self.streaming = perf_config.get("streaming", False)
         
         # 환경 변수에서 오버라이드
@@ -29,6 +41,15 @@ class OptimizationConfig:
             self.use_parallel = os.getenv("RAI_USE_PARALLEL").lower() == "true"
         if os.getenv("RAI_N_JOBS"):
             self.n_jobs = int(os.getenv("RAI_N_JOBS"))
+
+        # 평가 루프에서 배치마다 호출되는 판단 로직을 위해 미리 계산
+        self._parallel_threshold = self.PARALLEL_MIN_SIZE if self.use_parallel else float("inf")
+        if isinstance(self.sample_size, float) and 0 < self.sample_size < 1:
+            self._frac_sample = self.sample_size
+            self._abs_sample = None
+        else:
+            self._frac_sample = None
+            self._abs_sample = self.sample_size
     
     def get_sample_size(self, data_size: int) -> int:
         """
@@ -40,15 +61,15 @@ class OptimizationConfig:
         Returns:
             샘플 크기
         """
-        if self.sample_size is None:
-            return data_size
-        
-        if isinstance(self.sample_size, float) and 0 < self.sample_size < 1:
+        if self._frac_sample is not None:
             # 비율로 지정된 경우
-            return int(data_size * self.sample_size)
+            return int(data_size * self._frac_sample)
+        
+        if self._abs_sample is None:
+            return data_size
         
         # 절대값으로 지정된 경우
-        return min(self.sample_size, data_size)
+        return min(self._abs_sample, data_size)
     
     def should_use_parallel(self, data_size: int) -> bool:
         """
@@ -60,11 +81,7 @@ class OptimizationConfig:
         Returns:
             병렬 처리 사용 여부
         """
-        if not self.use_parallel:
-            return False
-        
-        # 작은 데이터는 병렬 처리 오버헤드가 더 큼
-        return data_size > 1000
+        return data_size > self._parallel_threshold
 
 
 # 전역 최적화 설정 인스턴스
@@ -105,18 +122,36 @@ def optimize_data_for_evaluation(
     Returns:
         최적화된 데이터 (X, y)
     """
+    from .performance import PerformanceOptimizer
+
     opt_config = get_optimization_config(config)
     
     # 샘플링
     sample_size = opt_config.get_sample_size(len(X))
     if sample_size < len(X):
-        indices = np.random.choice(len(X), sample_size, replace=False)
-        X = X[indices]
-        y = y[indices]
-    
-    # 메모리 최적화
-    from .performance import PerformanceOptimizer
-    X = PerformanceOptimizer.optimize_memory_usage(X)
+        rng = np.random.default_rng(opt_config.random_state)
+        indices = PerformanceOptimizer.sample_indices(len(X), sample_size, rng)
+        # 샘플링과 메모리 최적화(dtype 축소)를 출력 배열에 직접 기록
+        X_out = np.empty(
+            (len(indices),) + X.shape[1:],
+            dtype=PerformanceOptimizer.memory_efficient_dtype(X.dtype)
+        )
+        if X_out.dtype == X.dtype:
+            # 인덱스가 이미 범위 안이므로 mode="clip"이면 임시 버퍼 없이 out에 바로 기록
+            np.take(X, indices, axis=0, out=X_out, mode="clip")
+        else:
+            # dtype이 다르면 np.take가 원본 dtype 임시 배열을 만들므로, 행 블록 단위로
+            # 모아 변환하여 임시 메모리를 블록 크기로 제한
+            row_bytes = max(1, X.itemsize * int(np.prod(X.shape[1:])))
+            rows_per_block = max(1, _GATHER_BLOCK_BYTES // row_bytes)
+            for start in range(0, len(indices), rows_per_block):
+                block = indices[start:start + rows_per_block]
+                X_out[start:start + len(block)] = X[block]
+        X = X_out
+        y = np.take(y, indices, axis=0)
+    else:
+        # 메모리 최적화
+        X = PerformanceOptimizer.optimize_memory_usage(X)
     
     return X, y
 
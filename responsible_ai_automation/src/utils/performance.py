@@ -3,21 +3,133 @@
 """
 
 import numpy as np
-from typing import List, Callable, Any, Optional
-from functools import lru_cache
+from typing import Dict, List, Callable, Any, Optional, Tuple
+from functools import lru_cache, wraps
 from multiprocessing import Pool, cpu_count
+from collections import OrderedDict
+import atexit
 import hashlib
 import pickle
+import struct
+import weakref
+
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+
+# 호출 간에 재사용하는 단일 워커 풀 (호출마다 풀을 새로 띄우는 비용 방지)
+_POOL: Optional[Any] = None
+_POOL_SIZE = 0
+
+
+def _get_pool(n_processes: int) -> Any:
+    """
+    n_processes개 워커를 가진 공유 풀 가져오기
+
+    같은 프로세스 수로 호출하면 기존 풀을 재사용하고, 다른 수를 요청하면 기존 풀을
+    종료한 뒤 요청 크기로 다시 생성하므로 워커 수는 항상 요청과 같고 풀은 하나만 유지됩니다.
+    """
+    global _POOL, _POOL_SIZE
+    if _POOL is None or n_processes != _POOL_SIZE:
+        _shutdown_pools()
+        _POOL = Pool(processes=n_processes)
+        _POOL_SIZE = n_processes
+    return _POOL
+
+
+@atexit.register
+def _shutdown_pools():
+    """공유 풀 종료 (인터프리터 종료 시에도 호출)"""
+    global _POOL, _POOL_SIZE
+    if _POOL is not None:
+        _POOL.terminate()
+        _POOL.join()
+        _POOL = None
+        _POOL_SIZE = 0
+
+
+# 배열 해시 시 한 번에 입력하는 바이트 수 (L2 캐시에 들어가는 크기)
+_HASH_CHUNK_BYTES = 1 << 20
+
+# xxhash가 없을 때 이 크기 이상의 연속 배열은 MD5 대신 Numba 지문 커널로 해시
+_NUMBA_HASH_MIN_BYTES = 1 << 20
+
+
+def _fingerprint_blocks(words: np.ndarray, block_words: int) -> np.ndarray:
+    """
+    64비트 워드 배열의 블록별 지문 계산 (비암호학적, 캐시 키 용도)
+
+    블록마다 독립적으로 계산하므로 Numba에서는 블록 단위로 병렬 실행됩니다.
+
+    Args:
+        words: uint64 배열
+        block_words: 블록당 워드 수
+
+    Returns:
+        블록별 지문 (uint64)
+    """
+    n_blocks = (words.shape[0] + block_words - 1) // block_words
+    fingerprints = np.empty(n_blocks, dtype=np.uint64)
+    for block in prange(n_blocks):
+        h = np.uint64(0xcbf29ce484222325) ^ np.uint64(block)
+        end = min((block + 1) * block_words, words.shape[0])
+        for i in range(block * block_words, end):
+            h = (h ^ words[i]) * np.uint64(0x100000001b3)
+            h ^= h >> np.uint64(29)
+        fingerprints[block] = h
+    return fingerprints
+
+
+if NUMBA_AVAILABLE:
+    _fingerprint_blocks = njit(cache=True, parallel=True)(_fingerprint_blocks)
+
+# 불변 버퍼 배열의 다이제스트 캐시: id(arr) -> (약한 참조, 버퍼 서명, 다이제스트)
+# 배열이 해제되면 약한 참조 콜백으로 항목이 제거됨
+_ARRAY_DIGESTS: Dict[int, Tuple[Any, tuple, bytes]] = {}
+
+
+def _is_immutable(arr: np.ndarray) -> bool:
+    """
+    배열 메모리가 읽기 전용 버퍼(bytes, 읽기 모드 mmap 등)에 있어 내용이 바뀔 수 없는지 확인
+
+    데이터를 소유한 배열은 writeable 플래그를 다시 켜고 수정할 수 있으므로 해당하지 않습니다.
+    """
+    base = arr
+    while isinstance(base, np.ndarray):
+        base = base.base
+    if base is None:
+        return False
+    try:
+        return memoryview(base).readonly
+    except (TypeError, ValueError):
+        return False
 
 
 class PerformanceOptimizer:
     """성능 최적화 클래스"""
 
+    # 이보다 작은 작업은 풀 생성과 pickle 비용이 더 크므로 순차 처리
+    MIN_PARALLEL_CHUNKS = 3
+    MIN_PARALLEL_ROWS = 1000
+
     @staticmethod
     def parallel_evaluate(
         evaluator_func: Callable,
         data_chunks: List[Any],
-        n_processes: Optional[int] = None
+        n_processes: Optional[int] = None,
+        chunksize: Optional[int] = None,
+        ordered: bool = True,
+        reuse_pool: bool = True
     ) -> List[Any]:
         """
         병렬 평가 수행
@@ -25,7 +137,13 @@ class PerformanceOptimizer:
         Args:
             evaluator_func: 평가 함수
             data_chunks: 데이터 청크 리스트
-            n_processes: 프로세스 수 (None이면 CPU 코어 수)
+            n_processes: 프로세스 수 (None이면 CPU 코어 수와 청크 수 중 작은 값)
+            chunksize: 워커에 한 번에 보낼 청크 수 (None이면 청크 수 / (프로세스 수 * 4))
+            ordered: 결과를 data_chunks 순서로 반환할지 여부
+                (False면 완료 순서대로 받아 느린 청크에 막히지 않음)
+            reuse_pool: 모듈 공유 워커 풀을 호출 간에 재사용할지 여부.
+                재사용 풀의 워커는 처음 생성될 때 fork되므로, 그 이후 __main__에서
+                정의한 evaluator_func를 쓰는 경우에는 False로 지정
 
         Returns:
             평가 결과 리스트
@@ -33,40 +151,113 @@ class PerformanceOptimizer:
         if n_processes is None:
             n_processes = min(cpu_count(), len(data_chunks))
 
-        if n_processes <= 1:
+        if n_processes <= 1 or PerformanceOptimizer._is_small_workload(data_chunks):
             return [evaluator_func(chunk) for chunk in data_chunks]
 
-        with Pool(processes=n_processes) as pool:
-            results = pool.map(evaluator_func, data_chunks)
+        if chunksize is None:
+            # 작업마다 pickle/IPC 왕복이 생기지 않도록 여러 청크를 묶어서 전달
+            chunksize = max(1, len(data_chunks) // (n_processes * 4))
+
+        if not reuse_pool:
+            with Pool(processes=n_processes) as pool:
+                return PerformanceOptimizer._run_pool(
+                    pool, evaluator_func, data_chunks, chunksize, ordered
+                )
+
+        return PerformanceOptimizer._run_pool(
+            _get_pool(n_processes), evaluator_func, data_chunks, chunksize, ordered
+        )
 
-        return results
+    @staticmethod
+    def _is_small_workload(data_chunks: List[Any]) -> bool:
+        """청크 수나 전체 행 수가 병렬 처리 기준보다 작은지 확인"""
+        if len(data_chunks) < PerformanceOptimizer.MIN_PARALLEL_CHUNKS:
+            return True
+        total_rows = 0
+        for chunk in data_chunks:
+            if not hasattr(chunk, "__len__"):
+                # 크기를 알 수 없는 청크가 있으면 청크 수만으로 판단
+                return False
+            total_rows += len(chunk)
+        return total_rows < PerformanceOptimizer.MIN_PARALLEL_ROWS
+
+    @staticmethod
+    def _run_pool(
+        pool: Any,
+        evaluator_func: Callable,
+        data_chunks: List[Any],
+        chunksize: int,
+        ordered: bool
+    ) -> List[Any]:
+        """풀에서 청크 평가 실행"""
+        if ordered:
+            return pool.map(evaluator_func, data_chunks, chunksize=chunksize)
+        return list(pool.imap_unordered(evaluator_func, data_chunks, chunksize=chunksize))
 
     @staticmethod
-    def cache_result(func: Callable) -> Callable:
+    def cache_result(
+        func: Optional[Callable] = None,
+        *,
+        maxsize: Optional[int] = 100
+    ) -> Callable:
         """
-        함수 결과 캐싱 데코레이터
+        함수 결과 캐싱 데코레이터 (LRU)
+
+        불변 버퍼(bytes, 읽기 모드 mmap 등) 위의 배열 인자는 버퍼 해시를 한 번만 계산하고
+        재사용하므로, 같은 배열로 반복 호출할 때 배열 전체를 다시 읽지 않습니다.
 
         Args:
             func: 캐싱할 함수
+            maxsize: 최대 캐시 항목 수 (초과 시 가장 오래 사용하지 않은 항목 제거, None이면 무제한).
+                보통 OptimizationConfig.cache_size를 전달
 
         Returns:
-            캐싱된 함수
+            캐싱된 함수 (cache_info(), cache_clear() 제공)
         """
-        cache_dict = {}
+        if func is None:
+            return lambda f: PerformanceOptimizer.cache_result(f, maxsize=maxsize)
+
+        cache_dict: "OrderedDict[str, Any]" = OrderedDict()
+        stats = {"hits": 0, "misses": 0}
 
+        @wraps(func)
         def cached_func(*args, **kwargs):
             # 인자 기반 캐시 키 생성
             cache_key = PerformanceOptimizer._generate_cache_key(args, kwargs)
 
             if cache_key in cache_dict:
+                stats["hits"] += 1
+                cache_dict.move_to_end(cache_key)
                 return cache_dict[cache_key]
 
+            stats["misses"] += 1
             result = func(*args, **kwargs)
             cache_dict[cache_key] = result
+            if maxsize is not None and len(cache_dict) > maxsize:
+                cache_dict.popitem(last=False)
             return result
 
+        def cache_info() -> Dict[str, Any]:
+            """캐시 적중/미스 횟수와 크기"""
+            return {**stats, "maxsize": maxsize, "currsize": len(cache_dict)}
+
+        def cache_clear():
+            """캐시 비우기"""
+            cache_dict.clear()
+            stats["hits"] = stats["misses"] = 0
+
+        cached_func.cache_info = cache_info
+        cached_func.cache_clear = cache_clear
         return cached_func
 
+    @staticmethod
+    def _new_hasher() -> Any:
+        """캐시 키용 해시 객체 생성 (xxhash가 없으면 MD5 사용)"""
+        if XXHASH_AVAILABLE:
+            # 128비트로 캐시 키 충돌 가능성을 MD5 수준으로 유지 (속도는 xxh3_64와 같음)
+            return xxhash.xxh3_128()
+        return hashlib.md5()
+
     @staticmethod
     def _generate_cache_key(args: tuple, kwargs: dict) -> str:
         """
@@ -79,62 +270,182 @@ class PerformanceOptimizer:
         Returns:
             캐시 키 문자열
         """
-        # 인자를 해시 가능한 형태로 변환
-        key_data = {
-            'args': PerformanceOptimizer._hash_array(args),
-            'kwargs': {k: PerformanceOptimizer._hash_array(v) if isinstance(v, np.ndarray) else v
-                      for k, v in kwargs.items()}
-        }
+        # 문자열로 변환하지 않고 하나의 해시 객체에 인자를 순서대로 입력
+        # (키워드 인자는 이름순으로 넣어 전달 순서와 무관하게 같은 키가 되도록 함)
+        hasher = PerformanceOptimizer._new_hasher()
+        PerformanceOptimizer._hash_array(args, hasher)
+        for key in sorted(kwargs):
+            encoded_key = key.encode()
+            hasher.update(struct.pack("<q", len(encoded_key)))
+            hasher.update(encoded_key)
+            PerformanceOptimizer._hash_array(kwargs[key], hasher)
+        return hasher.hexdigest()
+
+    @staticmethod
+    def _hash_array(arr: Any, hasher: Any) -> None:
+        """
+        배열 해시 갱신
 
-        key_str = str(key_data)
-        return hashlib.md5(key_str.encode()).hexdigest()
+        Args:
+            arr: 배열, 리스트/튜플 또는 스칼라
+            hasher: 갱신할 해시 객체
+        """
+        if isinstance(arr, np.ndarray):
+            # dtype과 shape를 함께 넣어 같은 바이트열의 다른 배열과 구분
+            hasher.update(b"ndarray")
+            hasher.update(arr.dtype.str.encode())
+            hasher.update(struct.pack(f"<I{arr.ndim}q", arr.ndim, *arr.shape))
+            if arr.dtype.hasobject:
+                hasher.update(repr(arr.tolist()).encode())
+            else:
+                hasher.update(PerformanceOptimizer._array_digest(arr))
+        elif isinstance(arr, (list, tuple)):
+            hasher.update(struct.pack("<cq", b"l" if isinstance(arr, list) else b"t", len(arr)))
+            for item in arr:
+                PerformanceOptimizer._hash_array(item, hasher)
+        else:
+            hasher.update(type(arr).__name__.encode())
+            hasher.update(repr(arr).encode())
 
     @staticmethod
-    def _hash_array(arr: Any) -> str:
+    def _array_digest(arr: np.ndarray) -> bytes:
         """
-        배열 해시 생성
+        배열 버퍼 다이제스트 계산
+
+        불변 버퍼 위의 배열은 id와 버퍼 서명(데이터 포인터, shape, strides)이 같으면
+        이전에 계산한 다이제스트를 그대로 반환합니다. 읽기 전용 플래그만 설정된 배열은
+        호출자가 플래그를 다시 켜고 수정할 수 있으므로 매번 새로 계산합니다.
 
         Args:
-            arr: 배열 또는 스칼라
+            arr: 배열 (object dtype 제외)
 
         Returns:
-            해시 문자열
+            다이제스트 바이트열
         """
-        if isinstance(arr, np.ndarray):
-            # 배열의 해시 생성 (크기와 데이터 기반)
-            return hashlib.md5(
-                str(arr.shape).encode() + arr.tobytes()
-            ).hexdigest()
-        elif isinstance(arr, (list, tuple)):
-            return str([PerformanceOptimizer._hash_array(item) for item in arr])
+        immutable = _is_immutable(arr)
+        if immutable:
+            signature = (arr.__array_interface__["data"][0], arr.shape, arr.strides, arr.dtype.str)
+            cached = _ARRAY_DIGESTS.get(id(arr))
+            if cached is not None and cached[0]() is arr and cached[1] == signature:
+                return cached[2]
+
+        hasher = PerformanceOptimizer._new_hasher()
+        if (
+            not XXHASH_AVAILABLE
+            and NUMBA_AVAILABLE
+            and arr.flags.c_contiguous
+            and arr.nbytes >= _NUMBA_HASH_MIN_BYTES
+        ):
+            # MD5로 큰 버퍼 전체를 읽는 대신 블록 지문을 병렬로 계산하고 지문만 해시
+            # (비연속 배열은 아래 스트리밍 경로를 쓰므로 같은 내용이어도 다이제스트가 다를 수 있음)
+            raw = arr.reshape(-1).view(np.uint8)
+            n_word_bytes = raw.nbytes - raw.nbytes % 8
+            fingerprints = _fingerprint_blocks(
+                raw[:n_word_bytes].view(np.uint64), _HASH_CHUNK_BYTES // 8
+            )
+            hasher.update(fingerprints)
+            hasher.update(raw[n_word_bytes:])
+        elif arr.flags.c_contiguous:
+            # tobytes() 복사 없이 원본 버퍼를 캐시에 들어가는 크기로 나눠 입력
+            buffer = memoryview(arr.reshape(-1).view(np.uint8))
+            for start in range(0, buffer.nbytes, _HASH_CHUNK_BYTES):
+                hasher.update(buffer[start:start + _HASH_CHUNK_BYTES])
         else:
-            return str(arr)
+            # 비연속 배열은 전체를 복사하지 않고 행 블록 단위로만 연속 배열로 만들어 입력
+            # (C 순서 바이트열이 같으므로 연속 배열과 같은 다이제스트가 나옴)
+            rows_per_chunk = max(1, _HASH_CHUNK_BYTES // max(1, arr[0].nbytes))
+            for start in range(0, arr.shape[0], rows_per_chunk):
+                block = np.ascontiguousarray(arr[start:start + rows_per_chunk])
+                hasher.update(block.reshape(-1).view(np.uint8))
+        digest = hasher.digest()
+
+        if immutable:
+            key = id(arr)
+            ref = weakref.ref(arr, lambda _, key=key: _ARRAY_DIGESTS.pop(key, None))
+            _ARRAY_DIGESTS[key] = (ref, signature, digest)
+        return digest
+
+    @staticmethod
+    def memory_efficient_dtype(dtype: np.dtype) -> np.dtype:
+        """
+        메모리를 절약하는 대상 dtype 선택
+
+        Args:
+            dtype: 원본 dtype
+
+        Returns:
+            float64/float32는 float32, int64는 int32, 그 외는 원본 dtype
+        """
+        # float64를 float32로 변환 (메모리 절약)
+        if dtype == np.float64 or dtype == np.float32:
+            return np.dtype(np.float32)
+        if dtype == np.int64:
+            return np.dtype(np.int32)
+        return np.dtype(dtype)
 
     @staticmethod
-    def optimize_memory_usage(data: np.ndarray, target_dtype: Optional[type] = None) -> np.ndarray:
+    def optimize_memory_usage(
+        data: np.ndarray,
+        target_dtype: Optional[type] = None,
+        prefer_float16: bool = False
+    ) -> np.ndarray:
         """
         메모리 사용량 최적화
 
         Args:
             data: 최적화할 데이터 배열
             target_dtype: 목표 데이터 타입 (None이면 자동 선택)
+            prefer_float16: 자동 선택 시 값이 float16 범위 안이면 float16으로 변환
+                (공정성 통계나 순위처럼 정밀도가 덜 중요한 평가 경로용)
 
         Returns:
-            최적화된 데이터 배열
+            최적화된 데이터 배열 (변환이 필요 없으면 원본 그대로)
         """
         if target_dtype is None:
-            # float64를 float32로 변환 (메모리 절약)
-            if data.dtype == np.float64:
-                target_dtype = np.float32
-            elif data.dtype == np.int64:
-                target_dtype = np.int32
-            else:
-                return data
+            target_dtype = PerformanceOptimizer.memory_efficient_dtype(data.dtype)
+            if (
+                prefer_float16
+                and target_dtype == np.float32
+                and data.size
+                # np.abs(data)처럼 전체 크기 임시 배열을 만들지 않고 최대/최소로 범위 확인
+                and max(data.max(), -data.min()) <= np.finfo(np.float16).max
+            ):
+                target_dtype = np.float16
+
+        # dtype이 같으면 복사하지 않고 원본을 반환
+        return data.astype(target_dtype, copy=False)
+
+    @staticmethod
+    def sample_indices(
+        n: int,
+        sample_size: int,
+        rng: np.random.Generator
+    ) -> np.ndarray:
+        """
+        비복원 샘플링 인덱스 생성
+
+        sample_size가 n에 비해 작으면 전체 순열을 만들지 않고 정수를 뽑아 중복을 제거하며,
+        그 외에는 셔플 없이 choice를 사용합니다.
 
-        if data.dtype != target_dtype:
-            return data.astype(target_dtype)
+        Args:
+            n: 전체 데이터 크기
+            sample_size: 샘플 크기
+            rng: 난수 생성기
 
-        return data
+        Returns:
+            정렬된 샘플 인덱스
+        """
+        if sample_size < 0.1 * n:
+            indices = np.unique(rng.integers(0, n, size=int(sample_size * 1.1) + 1))
+            while len(indices) < sample_size:
+                extra = rng.integers(0, n, size=sample_size - len(indices) + 1)
+                indices = np.union1d(indices, extra)
+            if len(indices) > sample_size:
+                # 낮은 인덱스로 치우치지 않도록 초과분은 무작위로 제거
+                indices = np.sort(rng.choice(indices, sample_size, replace=False, shuffle=False))
+            return indices
+
+        return np.sort(rng.choice(n, sample_size, replace=False, shuffle=False))
 
     @staticmethod
     def sample_data(
@@ -151,14 +462,14 @@ class PerformanceOptimizer:
             random_state: 랜덤 시드
 
         Returns:
-            샘플링된 데이터
+            샘플링된 데이터 (원래 행 순서 유지)
         """
         if len(data) <= sample_size:
             return data
 
-        rng = np.random.RandomState(random_state)
-        indices = rng.choice(len(data), sample_size, replace=False)
-        return data[indices]
+        rng = np.random.default_rng(random_state)
+        indices = PerformanceOptimizer.sample_indices(len(data), sample_size, rng)
+        return np.take(data, indices, axis=0)
 
     @staticmethod
     def stream_evaluate(
@@ -3,11 +3,11 @@
 """
 
 import os
+import base64
 import hashlib
-import secrets
-from typing import Dict, Any, Optional, List
-from datetime import datetime, timedelta
-from collections import defaultdict
+import time
+from typing import Dict, Any, Optional, List, Deque
+from collections import defaultdict, deque
 import logging
 
 try:
@@ -15,12 +15,36 @@ try:
     from cryptography.hazmat.primitives import hashes
     from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
     from cryptography.hazmat.backends import default_backend
-    import base64
     CRYPTOGRAPHY_AVAILABLE = True
 except ImportError:
     CRYPTOGRAPHY_AVAILABLE = False
 
 
+def _derive_fernet(master_key: str) -> "Fernet":
+    """
+    마스터 키에서 Fernet 객체 생성
+
+    PBKDF2(100,000회 반복)는 의도적으로 비싼 연산이므로 호출자(APIKeyManager)가
+    인스턴스마다 한 번만 호출하고 결과를 보관합니다. 마스터 키와 유도된 키가
+    프로세스 전역에 남지 않도록 모듈 수준 캐시는 두지 않습니다.
+
+    Args:
+        master_key: 마스터 키
+
+    Returns:
+        Fernet 객체
+    """
+    kdf = PBKDF2HMAC(
+        algorithm=hashes.SHA256(),
+        length=32,
+        salt=b"responsible_ai_salt",
+        iterations=100000,
+        backend=default_backend()
+    )
+    key_bytes = base64.urlsafe_b64encode(kdf.derive(master_key.encode()))
+    return Fernet(key_bytes)
+
+
 class APIKeyManager:
     """API 키 관리 클래스"""
 
@@ -32,6 +56,8 @@ class APIKeyManager:
         self.config = config.get("security", {})
         self.key_storage_path = self.config.get("key_storage_path", "./.keys")
         self.logger = logging.getLogger(__name__)
+        # 암호화/복호화에 처음 필요할 때 생성
+        self._fernet: Optional["Fernet"] = None
 
         # 키 저장소 디렉토리 생성
         os.makedirs(self.key_storage_path, exist_ok=True)
@@ -106,33 +132,63 @@ class APIKeyManager:
         Returns:
             새 API 키 또는 None
         """
-        # 새 키 생성
-        new_key = secrets.token_urlsafe(32)
+        return self.rotate_api_keys([key_name])[key_name]
 
-        if self.store_api_key(key_name, new_key):
-            self.logger.info(f"API 키 로테이션 완료: {key_name}")
-            return new_key
+    def rotate_api_keys(self, key_names: List[str]) -> Dict[str, Optional[str]]:
+        """
+        여러 API 키를 한 번에 로테이션
 
-        return None
+        Args:
+            key_names: 키 이름 리스트
+
+        Returns:
+            키 이름별 새 API 키 (저장 실패 시 None)
+        """
+        rotated = {}
+        for key_name, new_key in zip(key_names, self._generate_keys(len(key_names))):
+            if self.store_api_key(key_name, new_key):
+                self.logger.info(f"API 키 로테이션 완료: {key_name}")
+                rotated[key_name] = new_key
+            else:
+                rotated[key_name] = None
+        return rotated
+
+    @staticmethod
+    def _generate_keys(count: int, n_bytes: int = 32) -> List[str]:
+        """
+        URL-safe 랜덤 키 생성 (secrets.token_urlsafe(n_bytes)와 같은 형식)
+
+        난수는 os.urandom 한 번으로 모든 키에 필요한 만큼 읽습니다.
+
+        Args:
+            count: 생성할 키 개수
+            n_bytes: 키당 랜덤 바이트 수
+
+        Returns:
+            키 리스트
+        """
+        random_bytes = os.urandom(n_bytes * count)
+        return [
+            base64.urlsafe_b64encode(random_bytes[i:i + n_bytes]).rstrip(b"=").decode("ascii")
+            for i in range(0, n_bytes * count, n_bytes)
+        ]
+
+    def _get_fernet(self) -> "Fernet":
+        """인스턴스의 Fernet 객체 (키 유도는 처음 한 번만 수행)"""
+        if self._fernet is None:
+            # 마스터 키 생성 (실제로는 안전한 곳에 저장해야 함)
+            master_key = os.getenv("MASTER_ENCRYPTION_KEY")
+            if master_key is None:
+                master_key = Fernet.generate_key().decode()
+            self._fernet = _derive_fernet(master_key)
+        return self._fernet
 
     def _encrypt_key(self, key: str) -> str:
         """키 암호화"""
         if not CRYPTOGRAPHY_AVAILABLE:
             return key
 
-        # 마스터 키 생성 (실제로는 안전한 곳에 저장해야 함)
-        master_key = os.getenv("MASTER_ENCRYPTION_KEY", Fernet.generate_key().decode())
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA256(),
-            length=32,
-            salt=b"responsible_ai_salt",
-            iterations=100000,
-            backend=default_backend()
-        )
-        key_bytes = base64.urlsafe_b64encode(kdf.derive(master_key.encode()))
-        fernet = Fernet(key_bytes)
-
-        return fernet.encrypt(key.encode()).decode()
+        return self._get_fernet().encrypt(key.encode()).decode()
 
     def _decrypt_key(self, encrypted_key: str) -> str:
         """키 복호화"""
@@ -140,18 +196,7 @@ class APIKeyManager:
             return encrypted_key
 
         try:
-            master_key = os.getenv("MASTER_ENCRYPTION_KEY", Fernet.generate_key().decode())
-            kdf = PBKDF2HMAC(
-                algorithm=hashes.SHA256(),
-                length=32,
-                salt=b"responsible_ai_salt",
-                iterations=100000,
-                backend=default_backend()
-            )
-            key_bytes = base64.urlsafe_b64encode(kdf.derive(master_key.encode()))
-            fernet = Fernet(key_bytes)
-
-            return fernet.decrypt(encrypted_key.encode()).decode()
+            return self._get_fernet().decrypt(encrypted_key.encode()).decode()
         except Exception as e:
             self.logger.error(f"키 복호화 실패: {e}")
             return encrypted_key
@@ -170,8 +215,8 @@ class RateLimiter:
         self.default_limit = self.config.get("limit", 100)  # 기본: 시간당 100회
         self.window_seconds = self.config.get("window_seconds", 3600)  # 기본: 1시간
 
-        # IP/사용자별 요청 기록
-        self.requests: Dict[str, List[datetime]] = defaultdict(list)
+        # IP/사용자별 요청 시각 (time.monotonic() 값, 오래된 순)
+        self.requests: Dict[str, Deque[float]] = defaultdict(deque)
         self.logger = logging.getLogger(__name__)
 
     def is_allowed(self, identifier: str, limit: Optional[int] = None) -> bool:
@@ -191,19 +236,12 @@ class RateLimiter:
         if limit is None:
             limit = self.default_limit
 
-        now = datetime.now()
-        cutoff_time = now - timedelta(seconds=self.window_seconds)
-
-        # 오래된 요청 기록 제거
-        self.requests[identifier] = [
-            req_time
-            for req_time in self.requests[identifier]
-            if req_time > cutoff_time
-        ]
+        now = time.monotonic()
+        count = self._prune_and_count(identifier, now)
 
         # 제한 확인
-        if len(self.requests[identifier]) >= limit:
-            self.logger.warning(f"Rate limit 초과: {identifier} ({len(self.requests[identifier])}/{limit})")
+        if count >= limit:
+            self.logger.warning("Rate limit 초과: %s (%d/%d)", identifier, count, limit)
             return False
 
         # 요청 기록 추가
@@ -224,16 +262,30 @@ class RateLimiter:
         if limit is None:
             limit = self.default_limit
 
-        now = datetime.now()
-        cutoff_time = now - timedelta(seconds=self.window_seconds)
+        return max(0, limit - self._prune_and_count(identifier, time.monotonic()))
 
-        self.requests[identifier] = [
-            req_time
-            for req_time in self.requests[identifier]
-            if req_time > cutoff_time
-        ]
+    def _prune_and_count(self, identifier: str, now: float) -> int:
+        """
+        윈도우를 벗어난 요청 기록을 제거하고 남은 요청 수 반환
+
+        기록이 시간순이므로 앞에서부터 만료된 항목만 확인하며, 만료된 항목이 없으면
+        비교 한 번으로 끝납니다.
+
+        Args:
+            identifier: 요청자 식별자
+            now: 현재 시각 (time.monotonic())
 
-        return max(0, limit - len(self.requests[identifier]))
+        Returns:
+            윈도우 내 요청 수
+        """
+        request_times = self.requests.get(identifier)
+        if not request_times:
+            return 0
+
+        cutoff_time = now - self.window_seconds
+        while request_times and request_times[0] <= cutoff_time:
+            request_times.popleft()
+        return len(request_times)
 
     def reset(self, identifier: Optional[str] = None) -> None:
         """
@@ -0,0 +1,83 @@
+"""
+공용 테스트 fixture
+
+PYTEST_DONT_REWRITE: fixture만 정의하고 assert가 없으므로 assert 재작성을 건너뜀
+"""
+
+import os
+
+# 작은 행렬에서는 스레드 시작 비용이 연산보다 크고, xdist 워커와 코어를 두고 경쟁하므로
+# numpy/BLAS가 로드되기 전에 스레드 수를 1로 고정
+for _var in ("OMP_NUM_THREADS", "MKL_NUM_THREADS", "OPENBLAS_NUM_THREADS"):
+    os.environ.setdefault(_var, "1")
+
+import pytest
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import RandomForestClassifier
+from threadpoolctl import threadpool_limits
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _single_threaded_blas():
+    """환경 변수 이전에 이미 초기화된 스레드 풀까지 단일 스레드로 제한"""
+    with threadpool_limits(limits=1):
+        yield
+
+
+def _make_xy(n_samples: int, n_features: int):
+    """고정 시드 분류 데이터 생성"""
+    rng = np.random.default_rng(42)
+    X = rng.random((n_samples, n_features))
+    y = rng.integers(0, 2, n_samples)
+    # 여러 테스트가 공유하므로 실수로 수정되지 않도록 읽기 전용으로 고정
+    X.flags.writeable = False
+    y.flags.writeable = False
+    return X, y
+
+
+def _fit_random_forest(X: np.ndarray, y: np.ndarray):
+    """
+    RandomForest 학습 및 학습 데이터 예측
+
+    평가기 API 계약만 확인하므로 트리 수와 깊이를 최소한으로 유지
+    """
+    model = RandomForestClassifier(
+        n_estimators=3, max_depth=4, random_state=42, n_jobs=1
+    ).fit(X, y)
+    y_pred = model.predict(X)
+    y_pred.flags.writeable = False
+    return model, X, y, y_pred
+
+
+@pytest.fixture(scope="session")
+def Xy_small():
+    """50x5 분류 데이터 (X, y)"""
+    return _make_xy(50, 5)
+
+
+@pytest.fixture(scope="session")
+def Xy_medium():
+    """100x10 분류 데이터 (X, y)"""
+    return _make_xy(100, 10)
+
+
+@pytest.fixture(scope="session")
+def sensitive_medium():
+    """Xy_medium과 같은 길이의 범주형 민감 속성 데이터프레임"""
+    # 범주형 dtype은 정수 코드로 groupby/비교하므로 object dtype보다 빠름
+    rng = np.random.default_rng(7)
+    codes = rng.integers(0, 2, 100)
+    return pd.DataFrame({"gender": pd.Categorical.from_codes(codes, categories=["M", "F"])})
+
+
+@pytest.fixture(scope="session")
+def trained_rf_small(Xy_small):
+    """Xy_small로 학습된 RandomForest (model, X, y, y_pred)"""
+    return _fit_random_forest(*Xy_small)
+
+
+@pytest.fixture(scope="session")
+def trained_rf_medium(Xy_medium):
+    """Xy_medium으로 학습된 RandomForest (model, X, y, y_pred)"""
+    return _fit_random_forest(*Xy_medium)
@@ -5,7 +5,6 @@
 import pytest
 import numpy as np
 import pandas as pd
-from sklearn.ensemble import RandomForestClassifier
 from src.auto_update.conditions import UpdateConditions
 from src.auto_update.updater import ModelUpdater
 from src.auto_update.rollback import RollbackManager
@@ -0,0 +1,87 @@
+"""
+배치 처리 유틸리티 테스트
+"""
+
+from multiprocessing import shared_memory
+
+import pytest
+import numpy as np
+from src.utils.batch_processor import BatchProcessor
+
+
+def _scale_rows(batch: np.ndarray, factor: float, offset: float = 0.0) -> np.ndarray:
+    """배치 행에 배율과 오프셋 적용 (프로세스 워커에서 pickle 가능한 모듈 수준 함수)"""
+    return batch * factor + offset
+
+
+def _fail_on_negative(batch: np.ndarray) -> np.ndarray:
+    """음수가 포함된 배치에서 실패"""
+    if (batch < 0).any():
+        raise ValueError("음수 포함")
+    return batch
+
+
+class _RecordingSharedMemory(shared_memory.SharedMemory):
+    """생성된 공유 메모리 이름을 기록하는 SharedMemory"""
+
+    created = []
+
+    def __init__(self, name=None, create=False, size=0):
+        super().__init__(name=name, create=create, size=size)
+        if create:
+            self.created.append(self.name)
+
+
+class TestBatchProcessorParallel:
+    """병렬 배치 처리 테스트 클래스"""
+
+    MODES = {
+        "process": {},
+        "thread": {"use_threads": True},
+        "shared_memory": {"use_shared_memory": True},
+    }
+
+    @pytest.fixture
+    def data(self):
+        """배치 크기로 나누어떨어지지 않는 2차원 배열"""
+        return np.arange(230, dtype=np.float64).reshape(115, 2)
+
+    @pytest.fixture
+    def recorded_shm(self, monkeypatch):
+        """공유 메모리 생성 이름 기록"""
+        monkeypatch.setattr(_RecordingSharedMemory, "created", [])
+        monkeypatch.setattr(shared_memory, "SharedMemory", _RecordingSharedMemory)
+        return _RecordingSharedMemory.created
+
+    @staticmethod
+    def _assert_unlinked(names):
+        """기록된 공유 메모리가 모두 해제되었는지 확인"""
+        for name in names:
+            with pytest.raises(FileNotFoundError):
+                shared_memory.SharedMemory(name=name)
+
+    @pytest.mark.parametrize("mode", list(MODES))
+    def test_modes_match_sequential(self, data, mode, recorded_shm):
+        """프로세스/스레드/공유 메모리 모드가 순차 처리와 같은 결과를 같은 순서로 반환하는지 테스트"""
+        processor = BatchProcessor(batch_size=20, max_workers=2, **self.MODES[mode])
+        expected = processor.process_in_batches(data, _scale_rows, 2.0, offset=1.0)
+
+        results = processor.process_parallel(data, _scale_rows, 2.0, offset=1.0)
+
+        assert len(results) == len(expected) == 6
+        for result, expected_batch in zip(results, expected):
+            np.testing.assert_array_equal(result, expected_batch)
+        assert len(recorded_shm) == (1 if mode == "shared_memory" else 0)
+        self._assert_unlinked(recorded_shm)
+
+    def test_shared_memory_unlinked_on_error(self, data, recorded_shm):
+        """워커에서 예외가 발생해도 공유 메모리가 해제되는지 테스트"""
+        data = data.copy()
+        data[50, 0] = -1.0
+        processor = BatchProcessor(batch_size=20, max_workers=2, use_shared_memory=True)
+
+        with pytest.raises(ValueError):
+            processor.process_parallel(data, _fail_on_negative)
+
+        assert len(recorded_shm) == 1
+        self._assert_unlinked(recorded_shm)
@@ -0,0 +1,46 @@
+"""
+대시보드 공용 유틸리티 테스트
+"""
+
+import pytest
+import numpy as np
+from src.monitoring.dashboard_base import lttb_indices
+
+
+class TestLttbIndices:
+    """LTTB 다운샘플링 테스트 클래스"""
+
+    @pytest.fixture
+    def series(self):
+        """노이즈가 섞인 1000포인트 시계열 (x, y)"""
+        rng = np.random.default_rng(0)
+        x = np.arange(1000, dtype=np.int64) * 1_000_000_000
+        y = np.sin(np.linspace(0, 20, 1000)) + rng.normal(0, 0.1, 1000)
+        return x, y
+
+    @pytest.mark.parametrize("n_out", [1000, 1500])
+    def test_identity_when_not_downsampling(self, series, n_out):
+        """n_out이 포인트 수 이상이면 모든 인덱스를 그대로 반환하는지 테스트"""
+        x, y = series
+
+        np.testing.assert_array_equal(lttb_indices(x, y, n_out), np.arange(len(y)))
+
+    @pytest.mark.parametrize("n_out", [3, 10, 500, 999])
+    def test_downsampled_indices(self, series, n_out):
+        """길이, 첫/마지막 포인트 유지, 단조 증가를 만족하는지 테스트"""
+        x, y = series
+
+        idx = lttb_indices(x, y, n_out)
+
+        assert len(idx) == n_out
+        assert idx[0] == 0
+        assert idx[-1] == len(y) - 1
+        assert np.all(np.diff(idx) > 0)
+
+    def test_keeps_extreme_point(self):
+        """단일 스파이크가 다운샘플링 후에도 유지되는지 테스트"""
+        x = np.arange(200)
+        y = np.zeros(200)
+        y[123] = 10.0
+
+        assert 123 in lttb_indices(x, y, 20)
@@ -0,0 +1,89 @@
+"""
+Streamlit 대시보드 렌더링 테스트
+"""
+
+import math
+
+import pytest
+from src.monitoring import dashboard_streamlit
+from src.monitoring.dashboard_streamlit import StreamlitDashboard
+
+
+class TestStreamlitDashboardOverview:
+    """개요 섹션 테스트 클래스"""
+
+    @pytest.fixture
+    def charts(self, monkeypatch):
+        """st.plotly_chart에 전달된 Figure 기록"""
+        figures = []
+        monkeypatch.setattr(
+            dashboard_streamlit.st, "plotly_chart", lambda fig, **kwargs: figures.append(fig)
+        )
+        return figures
+
+    def test_nan_score_renders_gauge(self, charts):
+        """종합 점수가 NaN이어도 게이지가 예외 없이 NaN 값으로 그려지는지 테스트"""
+        dashboard = StreamlitDashboard({})
+
+        dashboard._render_overview({"overall_responsible_ai_score": float("nan")})
+
+        assert len(charts) == 1
+        assert math.isnan(charts[0].data[0].value)
+
+    def test_finite_score_uses_cached_gauge(self, charts):
+        """같은 양자화 점수는 캐시된 게이지 Figure를 재사용하는지 테스트"""
+        dashboard = StreamlitDashboard({})
+
+        dashboard._render_overview({"overall_responsible_ai_score": 0.8123})
+        dashboard._render_overview({"overall_responsible_ai_score": 0.8124})
+
+        assert charts[0] is charts[1]
+        assert charts[0].data[0].value == pytest.approx(81.2)
+
+
+class TestStreamlitDashboardTrends:
+    """트렌드 섹션 테스트 클래스"""
+
+    @pytest.fixture
+    def session(self, monkeypatch):
+        """재실행 간에 유지되는 세션 상태 대역과 렌더링된 Figure 목록"""
+        state = {}
+        figures = []
+        monkeypatch.setattr(dashboard_streamlit.st, "session_state", state)
+        monkeypatch.setattr(
+            dashboard_streamlit.st, "plotly_chart", lambda fig, **kwargs: figures.append(fig)
+        )
+        return state, figures
+
+    @staticmethod
+    def _new_dashboard(scores):
+        """스크립트 재실행처럼 매번 새 대시보드 객체 생성"""
+        dashboard = StreamlitDashboard({})
+        for score in scores:
+            dashboard.log_metrics({"overall_responsible_ai_score": score})
+        return dashboard
+
+    def test_session_figure_reused_across_reruns(self, session, monkeypatch):
+        """재실행마다 대시보드가 새로 만들어져도 세션의 Figure를 재사용/확장하는지 테스트"""
+        state, figures = session
+        dashboard = self._new_dashboard([0.5, 0.6])
+        # 재실행에서도 히스토리는 같은 타임스탬프로 유지됨
+        history = dashboard.metrics_history
+        dashboard._render_trends()
+
+        rerun = StreamlitDashboard({})
+        rerun.metrics_history = list(history)
+        build_calls = []
+        monkeypatch.setattr(rerun, "_build_trend_figure", lambda: build_calls.append(1))
+        rerun._render_trends()
+
+        assert figures[1] is figures[0]
+        assert not build_calls
+
+        rerun.log_metrics({"overall_responsible_ai_score": 0.7})
+        rerun._render_trends()
+
+        assert figures[2] is figures[0]
+        assert not build_calls
+        assert list(figures[2].data[0].y) == pytest.approx([0.5, 0.6, 0.7])
+        assert state["rai_trend_rendered"] == 3
@@ -8,6 +8,23 @@ import pandas as pd
 from src.evaluation.fairness import FairnessEvaluator
 
 
+# 평가 입력은 읽기 전용이므로 모듈 수준 상수로 한 번만 생성
+_Y_TRUE_10 = np.array([0, 1, 0, 1, 0, 1, 0, 1, 0, 1])
+_Y_PRED_10 = _Y_TRUE_10.copy()
+_SF_10 = pd.DataFrame({
+    "gender": pd.Categorical(["M", "F"] * 5),
+    "race": pd.Categorical(["A", "B"] * 5),
+})
+
+_Y_TRUE_4 = np.array([0, 1, 0, 1])
+_Y_PRED_4 = _Y_TRUE_4.copy()
+_SF_GENDER_4 = pd.DataFrame({"gender": pd.Categorical(["M", "F"] * 2)})
+
+# 실수로 입력을 수정하면 바로 실패하도록 고정
+for _arr in (_Y_TRUE_10, _Y_PRED_10, _Y_TRUE_4, _Y_PRED_4):
+    _arr.flags.writeable = False
+
+
 class TestFairnessEvaluator:
     """공정성 평가 테스트 클래스"""
 
@@ -23,14 +40,7 @@ class TestFairnessEvaluator:
 
         evaluator = FairnessEvaluator(config)
 
-        y_true = np.array([0, 1, 0, 1, 0, 1, 0, 1, 0, 1])
-        y_pred = np.array([0, 1, 0, 1, 0, 1, 0, 1, 0, 1])
-        sensitive_features = pd.DataFrame({
-            "gender": ["M", "F", "M", "F", "M", "F", "M", "F", "M", "F"],
-            "race": ["A", "B", "A", "B", "A", "B", "A", "B", "A", "B"],
-        })
-
-        results = evaluator.evaluate(y_true, y_pred, sensitive_features)
+        results = evaluator.evaluate(_Y_TRUE_10, _Y_PRED_10, _SF_10)
 
         assert "overall_fairness_score" in results
         assert "metrics" in results
@@ -50,10 +60,7 @@ class TestFairnessEvaluator:
 
         evaluator = FairnessEvaluator(config)
 
-        y_true = np.array([0, 1, 0, 1])
-        y_pred = np.array([0, 1, 0, 1])
-
-        results = evaluator.evaluate(y_true, y_pred, None)
+        results = evaluator.evaluate(_Y_TRUE_4, _Y_PRED_4, None)
 
         assert results["overall_fairness_score"] == 0.0
         assert results["is_fair"] is False
@@ -71,11 +78,7 @@ class TestFairnessEvaluator:
 
         evaluator = FairnessEvaluator(config)
 
-        y_true = np.array([0, 1, 0, 1])
-        y_pred = np.array([0, 1, 0, 1])
-        sensitive_features = pd.DataFrame({"gender": ["M", "F", "M", "F"]})
-
-        results = evaluator.evaluate(y_true, y_pred, sensitive_features)
+        results = evaluator.evaluate(_Y_TRUE_4, _Y_PRED_4, _SF_GENDER_4)
 
         assert "overall_fairness_score" in results
         assert "gender" in results["metrics"]
@@ -0,0 +1,70 @@
+"""
+로깅 설정 테스트
+"""
+
+import logging
+
+import pytest
+from src.utils.logging_config import LazyRotatingHandler, setup_logging
+
+
+class TestLazyRotatingHandler:
+    """지연 생성 파일 핸들러 테스트 클래스"""
+
+    @pytest.fixture
+    def logger(self):
+        """전파하지 않는 전용 로거 (테스트 후 핸들러 정리)"""
+        test_logger = logging.getLogger("tests.lazy_rotating_handler")
+        test_logger.setLevel(logging.INFO)
+        test_logger.propagate = False
+        yield test_logger
+        for handler in list(test_logger.handlers):
+            test_logger.removeHandler(handler)
+            handler.close()
+
+    def test_file_created_on_first_record(self, tmp_path, logger):
+        """첫 logger.info 전에는 파일이 없고, 이후에는 기록된 파일이 생기는지 테스트"""
+        log_file = tmp_path / "logs" / "app.log"
+        handler = LazyRotatingHandler(str(log_file), maxBytes=1024, backupCount=1, encoding="utf-8")
+        handler.setFormatter(logging.Formatter("%(levelname)s:%(message)s"))
+        logger.addHandler(handler)
+
+        assert not log_file.parent.exists()
+
+        logger.info("첫 메시지")
+        handler.flush()
+
+        assert log_file.read_text(encoding="utf-8") == "INFO:첫 메시지\n"
+
+    def test_unwritable_path_does_not_raise(self, tmp_path, logger, monkeypatch):
+        """파일을 만들 수 없는 경로에서도 로그 호출이 예외를 던지지 않는지 테스트"""
+        # 일반 파일 아래의 경로는 권한과 무관하게 디렉터리를 만들 수 없음
+        blocker = tmp_path / "blocker"
+        blocker.write_text("")
+        handler = LazyRotatingHandler(str(blocker / "logs" / "app.log"))
+        logger.addHandler(handler)
+        errors = []
+        monkeypatch.setattr(handler, "handleError", errors.append)
+
+        logger.warning("경고")
+        logger.warning("경고")
+
+        assert len(errors) == 2
+        assert blocker.is_file()
+
+    def test_setup_logging_defers_file(self, tmp_path):
+        """setup_logging이 로그를 남기기 전까지 파일을 만들지 않는지 테스트"""
+        root = logging.getLogger()
+        saved_handlers, saved_level = root.handlers[:], root.level
+        log_file = tmp_path / "app.log"
+        try:
+            setup_logging(log_file=str(log_file))
+            assert not log_file.exists()
+
+            logging.getLogger("tests.setup_logging").info("기록")
+            assert log_file.exists()
+        finally:
+            for handler in root.handlers:
+                handler.close()
+            root.handlers[:] = saved_handlers
+            root.setLevel(saved_level)
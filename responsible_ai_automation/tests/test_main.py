@@ -4,9 +4,6 @@
 
 import pytest
 import numpy as np
-import pandas as pd
-from sklearn.ensemble import RandomForestClassifier
-from pathlib import Path
 import yaml
 
 from main import ResponsibleAIAutomationSystem
@@ -15,9 +12,10 @@ from main import ResponsibleAIAutomationSystem
 class TestResponsibleAIAutomationSystem:
     """Responsible AI Automation 시스템 테스트"""
 
-    @pytest.fixture
-    def config_file(self, tmp_path):
-        """임시 설정 파일 생성"""
+    @pytest.fixture(scope="session")
+    def config(self, tmp_path_factory):
+        """설정 딕셔너리 생성"""
+        tmp_path = tmp_path_factory.mktemp("system")
         config = {
             "evaluation": {
                 "fairness": {
@@ -71,34 +69,29 @@ class TestResponsibleAIAutomationSystem:
             },
         }
 
-        config_path = tmp_path / "config.yaml"
-        with open(config_path, "w", encoding="utf-8") as f:
-            yaml.dump(config, f)
+        return config
 
-        return str(config_path)
-
-    @pytest.fixture
-    def sample_data(self):
-        """샘플 데이터 생성"""
-        X = np.random.rand(100, 10)
-        y = np.random.randint(0, 2, 100)
-        sensitive_features = pd.DataFrame({"gender": np.random.choice(["M", "F"], 100)})
-        return X, y, sensitive_features
-
-    def test_system_initialization(self, config_file):
+    def test_system_initialization(self, config):
         """시스템 초기화 테스트"""
-        system = ResponsibleAIAutomationSystem(config_file)
+        system = ResponsibleAIAutomationSystem(config=config)
         assert system is not None
         assert system.evaluator is not None
         assert system.updater is not None
 
-    def test_model_initialization(self, config_file, sample_data):
-        """모델 초기화 테스트"""
-        system = ResponsibleAIAutomationSystem(config_file)
-        X, y, sensitive_features = sample_data
+    def test_system_initialization_from_file(self, config, tmp_path):
+        """설정 파일 경로로 시스템 초기화 테스트"""
+        config_path = tmp_path / "config.yaml"
+        with open(config_path, "w", encoding="utf-8") as f:
+            yaml.dump(config, f)
 
-        model = RandomForestClassifier(n_estimators=10, random_state=42)
-        model.fit(X, y)
+        system = ResponsibleAIAutomationSystem(str(config_path))
+        assert system.config == config
+
+    def test_model_initialization(self, config, trained_rf_medium, sensitive_medium):
+        """모델 초기화 테스트"""
+        system = ResponsibleAIAutomationSystem(config=config)
+        model, X, y, _ = trained_rf_medium
+        sensitive_features = sensitive_medium
 
         system.initialize_model(model, X, y, sensitive_features)
 
@@ -106,17 +99,15 @@ class TestResponsibleAIAutomationSystem:
         assert system.X is not None
         assert system.y is not None
 
-    def test_evaluation(self, config_file, sample_data):
+    @pytest.mark.slow
+    def test_evaluation(self, config, trained_rf_medium, sensitive_medium):
         """평가 테스트"""
-        system = ResponsibleAIAutomationSystem(config_file)
-        X, y, sensitive_features = sample_data
-
-        model = RandomForestClassifier(n_estimators=10, random_state=42)
-        model.fit(X, y)
+        system = ResponsibleAIAutomationSystem(config=config)
+        model, X, y, y_pred = trained_rf_medium
+        sensitive_features = sensitive_medium
 
         system.initialize_model(model, X, y, sensitive_features)
 
-        y_pred = model.predict(X)
         metrics = system.evaluate(X, y, y_pred, sensitive_features)
 
         assert "overall_responsible_ai_score" in metrics
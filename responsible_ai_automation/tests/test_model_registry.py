@@ -0,0 +1,168 @@
+"""
+모델 버전 관리 시스템 테스트 (MLflow 대역 사용)
+"""
+
+import importlib
+import sys
+import types
+from unittest.mock import ANY, MagicMock
+
+import pytest
+
+_MODULE_NAME = "src.utils.model_registry"
+
+# 등록 흐름에서 순서를 확인할 호출 이름
+_TRACKED_CALLS = {
+    "start_run",
+    "log_metrics",
+    "set_tags",
+    "log_batch",
+    "flush",
+    "log_model",
+    "await_completion",
+    "register_model",
+}
+
+
+@pytest.fixture
+def mlflow_mock(monkeypatch):
+    """sys.modules에 MLflow 대역을 넣고 model_registry를 새로 import"""
+    mlflow = MagicMock(name="mlflow")
+    for name in (
+        "mlflow",
+        "mlflow.sklearn",
+        "mlflow.entities",
+        "mlflow.tracking",
+        "mlflow.utils",
+        "mlflow.utils.autologging_utils",
+        "mlflow.utils.autologging_utils.client",
+    ):
+        module = mlflow
+        for attr in name.split(".")[1:]:
+            module = getattr(module, attr)
+        monkeypatch.setitem(sys.modules, name, module)
+
+    versions = iter(range(1, 100))
+    mlflow.register_model.side_effect = lambda uri, name: types.SimpleNamespace(
+        version=str(next(versions))
+    )
+
+    sys.modules.pop(_MODULE_NAME, None)
+    module = importlib.import_module(_MODULE_NAME)
+    yield types.SimpleNamespace(mlflow=mlflow, module=module)
+
+    sys.modules.pop(_MODULE_NAME, None)
+    sys.modules["src.utils"].__dict__.pop("model_registry", None)
+
+
+def _tracked_calls(mlflow):
+    """추적 대상 호출을 (이름, 호출 객체) 순서대로 반환"""
+    calls = []
+    for call in mlflow.mock_calls:
+        name = call[0].rsplit(".", 1)[-1]
+        if name in _TRACKED_CALLS:
+            calls.append((name, call))
+    return calls
+
+
+class TestModelRegistry:
+    """모델 레지스트리 테스트 클래스"""
+
+    def test_register_many_logs_each_spec_in_order(self, mlflow_mock):
+        """스펙마다 메트릭/태그 기록, 모델 저장, 대기, 등록이 순서대로 실행되는지 테스트"""
+        registry_module = mlflow_mock.module
+        registry = registry_module.ModelRegistry({"mlflow": {"experiment_name": "test"}})
+
+        specs = [
+            registry_module.RegistryRunSpec(
+                model="model_a",
+                metrics={
+                    "overall_responsible_ai_score": 0.95,
+                    "is_responsible": True,
+                    "fairness": {"overall_fairness_score": 0.9},
+                },
+                model_name="model_a",
+                tags={"owner": "team_a"},
+            ),
+            registry_module.RegistryRunSpec(
+                model="model_b",
+                metrics={"overall_responsible_ai_score": 0.5},
+                model_name="model_b",
+            ),
+        ]
+
+        versions = registry.register_many(specs)
+
+        assert versions == ["1", "2"]
+
+        calls = _tracked_calls(mlflow_mock.mlflow)
+        names = [name for name, _ in calls]
+        per_spec = [
+            "start_run",
+            "log_metrics",
+            "set_tags",
+            "flush",
+            "log_model",
+            "await_completion",
+            "register_model",
+        ]
+        assert names == per_spec * len(specs)
+
+        spec_calls = [calls[:len(per_spec)], calls[len(per_spec):]]
+        for spec, spec_call in zip(specs, spec_calls):
+            by_name = dict(spec_call)
+            _, metrics_args, _ = by_name["log_metrics"]
+            _, tags_args, _ = by_name["set_tags"]
+            _, model_args, _ = by_name["log_model"]
+            _, register_args, _ = by_name["register_model"]
+
+            assert metrics_args[1]["overall_responsible_ai_score"] == spec.metrics[
+                "overall_responsible_ai_score"
+            ]
+            for key, value in spec.tags.items():
+                assert tags_args[1][key] == value
+            assert model_args[0] == spec.model
+            assert register_args[1] == spec.model_name
+
+        first_metrics = dict(spec_calls[0])["log_metrics"][1][1]
+        assert first_metrics["is_responsible"] == 1.0
+        assert first_metrics["fairness_score"] == 0.9
+        assert dict(spec_calls[0])["set_tags"][1][1]["quality"] == "excellent"
+        assert dict(spec_calls[1])["set_tags"][1][1]["quality"] == "needs_improvement"
+
+    def test_register_many_reuses_client(self, mlflow_mock):
+        """여러 스펙을 등록해도 추적 클라이언트를 한 번만 생성하는지 테스트"""
+        registry_module = mlflow_mock.module
+        registry = registry_module.ModelRegistry({})
+
+        registry.register_many([
+            registry_module.RegistryRunSpec(model=f"model_{i}", metrics={}) for i in range(3)
+        ])
+
+        queueing_client_cls = registry_module.MlflowAutologgingQueueingClient
+        assert queueing_client_cls.call_count == 1
+
+    def test_register_model_without_queueing_client(self, mlflow_mock, monkeypatch):
+        """큐잉 클라이언트가 없으면 log_batch 한 번으로 메트릭/태그를 기록하는지 테스트"""
+        registry_module = mlflow_mock.module
+        monkeypatch.setattr(registry_module, "QUEUEING_CLIENT_AVAILABLE", False)
+        # 일반 MlflowClient에는 flush가 없음
+        registry_module.MlflowClient.return_value = MagicMock(
+            spec=["log_batch", "get_experiment_by_name", "create_experiment"]
+        )
+        registry = registry_module.ModelRegistry({})
+
+        version = registry.register_model(
+            "model", {"overall_responsible_ai_score": 0.8}, tags={"owner": "team_a"}
+        )
+
+        assert version == "1"
+        names = [name for name, _ in _tracked_calls(mlflow_mock.mlflow)]
+        assert names == ["start_run", "log_batch", "log_model", "register_model"]
+
+        _, args, kwargs = registry_module.MlflowClient.return_value.log_batch.mock_calls[0]
+        assert len(kwargs["metrics"]) == 2
+        assert len(kwargs["tags"]) == 2
+        registry_module.Metric.assert_any_call("overall_responsible_ai_score", 0.8, ANY, 0)
+        registry_module.RunTag.assert_any_call("quality", "good")
+        registry_module.RunTag.assert_any_call("owner", "team_a")
@@ -0,0 +1,57 @@
+"""
+최적화 설정 및 유틸리티 테스트
+"""
+
+import tracemalloc
+
+import pytest
+import numpy as np
+from src.utils import optimization
+from src.utils.optimization import optimize_data_for_evaluation
+from src.utils.performance import PerformanceOptimizer
+
+
+class TestOptimizeDataForEvaluation:
+    """평가 데이터 최적화 테스트 클래스"""
+
+    CONFIG = {"performance": {"sample_size": 20_000, "random_state": 0}}
+
+    @pytest.fixture(autouse=True)
+    def _reset_global_config(self, monkeypatch):
+        """다른 테스트가 먼저 만든 전역 최적화 설정 대신 CONFIG를 사용하도록 초기화"""
+        monkeypatch.setattr(optimization, "_global_optimization_config", None)
+
+    @pytest.mark.parametrize(
+        "dtype, expected_dtype",
+        [(np.float64, np.float32), (np.float32, np.float32), (np.int8, np.int8)],
+    )
+    def test_sampled_rows_and_dtype(self, dtype, expected_dtype):
+        """샘플링된 행이 원본 행과 같고 dtype이 축소되는지 테스트"""
+        rng = np.random.default_rng(0)
+        X = (rng.random((50_000, 4)) * 100).astype(dtype)
+        y = rng.integers(0, 2, len(X))
+
+        X_out, y_out = optimize_data_for_evaluation(X, y, self.CONFIG)
+
+        indices = PerformanceOptimizer.sample_indices(len(X), 20_000, np.random.default_rng(0))
+        assert X_out.dtype == expected_dtype
+        np.testing.assert_array_equal(X_out, X[indices].astype(expected_dtype))
+        np.testing.assert_array_equal(y_out, y[indices])
+
+    def test_downcast_peak_memory(self, monkeypatch):
+        """dtype 축소 샘플링의 임시 메모리가 블록 크기로 제한되는지 테스트"""
+        block_bytes = 1 << 16
+        monkeypatch.setattr(optimization, "_GATHER_BLOCK_BYTES", block_bytes)
+        X = np.random.default_rng(0).random((50_000, 10))
+        y = np.zeros(len(X), dtype=np.int8)
+
+        tracemalloc.start()
+        try:
+            X_out, y_out = optimize_data_for_evaluation(X, y, self.CONFIG)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        # 출력 X/y와 샘플 인덱스 외에는 블록 하나 정도만 추가로 사용
+        index_bytes = 20_000 * np.dtype(np.int64).itemsize
+        assert peak < X_out.nbytes + y_out.nbytes + index_bytes + 2 * block_bytes
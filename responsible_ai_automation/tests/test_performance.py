@@ -0,0 +1,208 @@
+"""
+성능 최적화 유틸리티 테스트
+"""
+
+import multiprocessing
+import tracemalloc
+
+import pytest
+import numpy as np
+from src.utils import performance
+from src.utils.performance import PerformanceOptimizer
+
+
+class TestParallelEvaluatePool:
+    """공유 워커 풀 테스트 클래스"""
+
+    @pytest.fixture(autouse=True)
+    def _shutdown_shared_pool(self):
+        """테스트 전후로 공유 풀 정리"""
+        performance._shutdown_pools()
+        yield
+        performance._shutdown_pools()
+
+    def test_pool_sized_to_request(self):
+        """풀 워커 수가 요청한 프로세스 수와 같고, 크기를 바꿔도 풀이 하나만 남는지 테스트"""
+        data_chunks = list(range(-12, 0))
+        expected = [abs(chunk) for chunk in data_chunks]
+
+        for _ in range(2):
+            for n_processes in (2, 3, 4, 2):
+                results = PerformanceOptimizer.parallel_evaluate(
+                    abs, data_chunks, n_processes=n_processes
+                )
+                assert results == expected
+                assert len(multiprocessing.active_children()) == n_processes
+
+    def test_pool_reused_for_same_size(self):
+        """같은 프로세스 수로 호출하면 기존 풀을 재사용하는지 테스트"""
+        PerformanceOptimizer.parallel_evaluate(abs, list(range(-6, 0)), n_processes=2)
+        pool = performance._POOL
+
+        PerformanceOptimizer.parallel_evaluate(abs, list(range(-6, 0)), n_processes=2)
+
+        assert performance._POOL is pool
+
+    def test_shutdown_pools_stops_workers(self):
+        """공유 풀 종료 후 워커 프로세스가 남지 않는지 테스트"""
+        PerformanceOptimizer.parallel_evaluate(abs, list(range(-6, 0)), n_processes=2)
+        assert multiprocessing.active_children()
+
+        performance._shutdown_pools()
+
+        assert not multiprocessing.active_children()
+
+
+class TestArrayDigestCache:
+    """불변 버퍼 배열 다이제스트 캐시 테스트 클래스"""
+
+    def test_refrozen_array_not_stale(self):
+        """고정 → 호출 → 해제 → 수정 → 재고정 → 호출 시 이전 결과를 반환하지 않는지 테스트"""
+        cached_sum = PerformanceOptimizer.cache_result(np.sum)
+        arr = np.arange(10, dtype=np.float64)
+        arr.flags.writeable = False
+        assert cached_sum(arr) == 45.0
+
+        # 중간에 조회 없이 해제/수정/재고정
+        arr.flags.writeable = True
+        arr += 100.0
+        arr.flags.writeable = False
+
+        assert cached_sum(arr) == 1045.0
+        assert id(arr) not in performance._ARRAY_DIGESTS
+
+    def test_immutable_buffer_digest_reused(self, tmp_path):
+        """bytes/읽기 모드 memmap 위의 배열만 다이제스트를 재사용하는지 테스트"""
+        from_bytes = np.frombuffer(np.arange(10, dtype=np.float64).tobytes())
+        path = tmp_path / "data.bin"
+        np.arange(10, dtype=np.float64).tofile(path)
+        mapped = np.memmap(path, dtype=np.float64, mode="r")
+
+        for arr in (from_bytes, mapped, mapped[::2]):
+            digest = PerformanceOptimizer._array_digest(arr)
+            assert performance._ARRAY_DIGESTS[id(arr)][2] == digest
+            assert PerformanceOptimizer._array_digest(arr) == digest
+            with pytest.raises(ValueError):
+                arr.flags.writeable = True
+
+
+class TestCacheResult:
+    """결과 캐싱 데코레이터 테스트 클래스"""
+
+    @pytest.fixture
+    def counted(self):
+        """호출 인자를 기록하는 함수와 호출 목록"""
+        calls = []
+
+        def func(*args, **kwargs):
+            calls.append((args, kwargs))
+            return len(calls)
+
+        return func, calls
+
+    def test_lru_eviction(self, counted):
+        """maxsize를 넘으면 가장 오래 사용하지 않은 항목이 제거되는지 테스트"""
+        func, calls = counted
+        cached = PerformanceOptimizer.cache_result(func, maxsize=2)
+
+        cached(1)
+        cached(2)
+        cached(1)  # 1을 최근 사용으로 갱신
+        cached(3)  # 2가 제거됨
+        assert len(calls) == 3
+
+        cached(1)
+        assert len(calls) == 3
+        cached(2)
+        assert len(calls) == 4
+
+    def test_cache_info_and_clear(self, counted):
+        """cache_info 통계와 cache_clear 초기화를 테스트"""
+        func, _ = counted
+        cached = PerformanceOptimizer.cache_result(maxsize=10)(func)
+
+        cached(1)
+        cached(1)
+        cached(2)
+        assert cached.cache_info() == {"hits": 1, "misses": 2, "maxsize": 10, "currsize": 2}
+
+        cached.cache_clear()
+        assert cached.cache_info() == {"hits": 0, "misses": 0, "maxsize": 10, "currsize": 0}
+
+    def test_key_independent_of_kwargs_order(self):
+        """키워드 인자 전달 순서와 무관하게 같은 키가 생성되는지 테스트"""
+        key = PerformanceOptimizer._generate_cache_key
+        arr = np.arange(6)
+
+        assert key((arr,), {"a": 1, "b": 2}) == key((arr,), {"b": 2, "a": 1})
+        assert key((arr,), {"a": 1, "b": 2}) != key((arr,), {"a": 2, "b": 1})
+
+    def test_key_independent_of_strides(self):
+        """내용이 같으면 연속/비연속 배열의 키가 같고, 내용이 다르면 키가 다른지 테스트"""
+        key = PerformanceOptimizer._generate_cache_key
+        base = np.arange(40, dtype=np.float64).reshape(10, 4)
+        strided = base[:, ::2]
+        contiguous = np.ascontiguousarray(strided)
+        assert not strided.flags.c_contiguous
+
+        assert key((strided,), {}) == key((contiguous,), {})
+        assert key((strided,), {}) != key((base[:, 1::2],), {})
+        # 바이트열이 같아도 shape가 다르면 다른 키
+        assert key((contiguous,), {}) != key((contiguous.reshape(-1),), {})
+
+
+class TestSampleIndices:
+    """샘플링 인덱스 테스트 클래스"""
+
+    @pytest.mark.parametrize("n, sample_size", [(10_000, 50), (10_000, 500), (100, 80), (100, 100)])
+    def test_sorted_unique_indices(self, n, sample_size):
+        """희소/밀집 경로 모두 정렬된 중복 없는 sample_size개 인덱스를 반환하는지 테스트"""
+        indices = PerformanceOptimizer.sample_indices(n, sample_size, np.random.default_rng(0))
+
+        assert len(indices) == sample_size
+        assert len(np.unique(indices)) == sample_size
+        assert np.all(np.diff(indices) > 0)
+        assert indices[0] >= 0 and indices[-1] < n
+
+    @pytest.mark.parametrize("sample_size", [50, 5000])
+    def test_reproducible_with_seed(self, sample_size):
+        """같은 시드의 난수 생성기로 같은 인덱스를 얻는지 테스트"""
+        first = PerformanceOptimizer.sample_indices(10_000, sample_size, np.random.default_rng(42))
+        second = PerformanceOptimizer.sample_indices(10_000, sample_size, np.random.default_rng(42))
+
+        np.testing.assert_array_equal(first, second)
+
+
+class TestOptimizeMemoryUsage:
+    """메모리 최적화 테스트 클래스"""
+
+    @pytest.mark.parametrize(
+        "values, expected_dtype",
+        [
+            ([0.5, -1.0, 100.0], np.float16),
+            ([0.5, -70000.0], np.float32),  # 음수 쪽이 float16 범위를 벗어남
+            ([0.5, 70000.0], np.float32),
+            ([0.5, np.nan], np.float32),
+        ],
+    )
+    def test_prefer_float16_range(self, values, expected_dtype):
+        """값 범위가 float16 안일 때만 float16으로 변환하는지 테스트"""
+        data = np.array(values, dtype=np.float64)
+
+        result = PerformanceOptimizer.optimize_memory_usage(data, prefer_float16=True)
+
+        assert result.dtype == expected_dtype
+
+    def test_prefer_float16_no_full_temporary(self):
+        """범위 확인에 입력 크기의 임시 배열을 만들지 않는지 테스트"""
+        data = np.random.default_rng(0).random(1_000_000)
+
+        tracemalloc.start()
+        try:
+            result = PerformanceOptimizer.optimize_memory_usage(data, prefer_float16=True)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert result.dtype == np.float16
+        assert peak < result.nbytes + data.nbytes // 4
@@ -2,35 +2,41 @@
 강화 학습 에이전트 테스트
 """
 
+import types
+
 import pytest
 import numpy as np
+from src.rl_agent import environment, hyperparameter_tuning
 from src.rl_agent.environment import RLIEnvironment
+from src.rl_agent.hyperparameter_tuning import HyperparameterTuner
 from src.rl_agent.agent import RLAIAgent
 from src.rl_agent.reward import RewardCalculator
 
 
+@pytest.fixture
+def env():
+    """기본 설정 RL 환경"""
+    return RLIEnvironment({})
+
+
+@pytest.fixture
+def reward_calc():
+    """기본 설정 보상 계산기"""
+    return RewardCalculator({})
+
+
 class TestRLIEnvironment:
     """RL 환경 테스트 클래스"""
 
-    def test_environment_reset(self):
-        """환경 초기화 테스트"""
-        config = {}
-        env = RLIEnvironment(config)
-
+    def test_environment_reset_and_step(self, env):
+        """환경 초기화 후 스텝 실행 테스트"""
         obs, info = env.reset()
 
         assert isinstance(obs, np.ndarray)
         assert obs.shape == (5,)
         assert "metrics" in info
 
-    def test_environment_step(self):
-        """환경 스텝 실행 테스트"""
-        config = {}
-        env = RLIEnvironment(config)
-
-        obs, _ = env.reset()
         action = np.array([0.1, 0.1, 0.1, 0.1, 0.1])
-
         obs, reward, terminated, truncated, info = env.step(action)
 
         assert isinstance(obs, np.ndarray)
@@ -39,19 +45,76 @@ class TestRLIEnvironment:
         assert isinstance(truncated, bool)
         assert "metrics" in info
 
+    @pytest.mark.parametrize("use_numba", [True, False])
+    def test_custom_target_termination(self, monkeypatch, use_numba):
+        """타겟을 바꾸면 두 스텝 구현 모두 새 타겟 기준으로 종료하는지 테스트"""
+        if use_numba and not environment.NUMBA_AVAILABLE:
+            pytest.skip("numba 미설치")
+        monkeypatch.setattr(environment, "NUMBA_AVAILABLE", use_numba)
+        env = RLIEnvironment({})
+        env.reset()
+        env.target_metrics = np.full(5, 0.6)
+
+        # 0.5 -> 0.55: 종료 기준(0.57) 미달
+        _, reward, terminated, _, _ = env.step(np.full(5, 0.5, dtype=np.float32))
+        assert not terminated
+        assert reward == pytest.approx(-0.05, abs=1e-6)
+
+        # 0.55 -> 0.6: 종료 기준 충족 (기본 타겟 0.8 기준이면 미달)
+        _, _, terminated, _, _ = env.step(np.full(5, 0.5, dtype=np.float32))
+        assert terminated
+
+    def test_step_returns_fresh_arrays(self, env):
+        """보관한 관찰과 info["metrics"]가 다음 스텝에서 덮어써지지 않는지 테스트"""
+        obs0, info0 = env.reset()
+        action = np.full(5, 0.5, dtype=np.float32)
+        obs1, _, _, _, info1 = env.step(action)
+        obs2, _, _, _, info2 = env.step(action)
+
+        np.testing.assert_allclose(obs0, 0.5)
+        np.testing.assert_allclose(obs1, 0.55, atol=1e-6)
+        np.testing.assert_allclose(info1["metrics"], 0.55, atol=1e-6)
+        np.testing.assert_allclose(obs2, 0.6, atol=1e-6)
+        assert not np.shares_memory(obs2, info2["metrics"])
+        assert not np.shares_memory(info2["metrics"], env.current_metrics)
+
+    def test_environment_float16_observation(self):
+        """float16 관찰 공간 테스트"""
+        config = {"reinforcement_learning": {"observation_dtype": "float16"}}
+        env = RLIEnvironment(config)
+
+        obs, _ = env.reset()
+        assert obs.dtype == np.float16
+        assert env.observation_space.contains(obs)
+
+        obs, _, _, _, _ = env.step(np.full(5, 0.5, dtype=np.float32))
+        assert obs.dtype == np.float16
+        assert env.observation_space.contains(obs)
+        np.testing.assert_allclose(obs, 0.55, atol=1e-3)
+
 
 class TestRLAIAgent:
     """RL 에이전트 테스트 클래스"""
 
-    def test_agent_initialization_ppo(self):
+    def test_agent_initialization_ppo(self, env):
         """PPO 에이전트 초기화 테스트"""
-        config = {}
+        agent = RLAIAgent(env, algorithm="PPO", config={})
+
+        assert agent.algorithm == "PPO"
+        assert agent.env == env
+
+    def test_agent_evaluate(self):
+        """에이전트 평가 테스트"""
+        config = {"reinforcement_learning": {"max_episode_steps": 10}}
         env = RLIEnvironment(config)
 
         agent = RLAIAgent(env, algorithm="PPO", config=config)
+        results = agent.evaluate(n_episodes=2)
 
-        assert agent.algorithm == "PPO"
-        assert agent.env == env
+        assert "mean_reward" in results
+        assert "std_reward" in results
+        assert results["mean_reward"] <= 0
+        assert 0 < results["mean_episode_length"] <= 10
 
     def test_agent_recommend_algorithm(self):
         """알고리즘 추천 테스트"""
@@ -70,31 +133,133 @@ class TestRLAIAgent:
 class TestRewardCalculator:
     """보상 계산 테스트 클래스"""
 
-    def test_reward_calculation_basic(self):
-        """기본 보상 계산 테스트"""
-        config = {}
-        calculator = RewardCalculator(config)
+    @pytest.mark.parametrize(
+        "current_metrics,previous_metrics,expected_min",
+        [
+            pytest.param(
+                {
+                    "overall_responsible_ai_score": 0.8,
+                    "fairness": {"overall_fairness_score": 0.75},
+                    "transparency": {"overall_transparency_score": 0.7},
+                },
+                None,
+                0.0,
+                id="basic",
+            ),
+            pytest.param(
+                {"overall_responsible_ai_score": 0.8},
+                {"overall_responsible_ai_score": 0.7},
+                0.8,  # 개선 보너스 포함
+                id="with_improvement",
+            ),
+        ],
+    )
+    def test_reward_calculation(self, reward_calc, current_metrics, previous_metrics, expected_min):
+        """보상 계산 테스트"""
+        reward = reward_calc.calculate_reward(current_metrics, previous_metrics)
+
+        assert isinstance(reward, float)
+        assert reward > expected_min
 
+    def test_reward_calculation_threshold_bonus(self, reward_calc):
+        """카테고리 임계값 충족 보상 테스트"""
         metrics = {
-            "overall_responsible_ai_score": 0.8,
+            "overall_responsible_ai_score": 0.5,
             "fairness": {"overall_fairness_score": 0.75},
-            "transparency": {"overall_transparency_score": 0.7},
+            "privacy": {"overall_privacy_score": 0.75},
+            "robustness": {},
         }
 
-        reward = calculator.calculate_reward(metrics)
+        reward = reward_calc.calculate_reward(metrics)
 
-        assert isinstance(reward, float)
-        assert reward > 0
+        # fairness만 임계값 충족
+        assert reward == pytest.approx(0.6)
+
+
+class _FakeTune:
+    """Ray Tune 대역: 샘플마다 Trainable을 만들고 stop 조건까지 step을 순차 실행"""
+
+    class Trainable:
+        def __init__(self, config):
+            self.config = config
+            self.setup(config)
+
+    @staticmethod
+    def uniform(low, high):
+        return low
+
+    @staticmethod
+    def randint(low, high):
+        return low
+
+    @staticmethod
+    def choice(choices):
+        return choices[0]
+
+    def __init__(self):
+        self.run_kwargs = None
+
+    def run(self, trainable_cls, config, num_samples, scheduler, stop, **kwargs):
+        self.run_kwargs = {"scheduler": scheduler, "stop": stop, **kwargs}
+        trials = []
+        for _ in range(num_samples):
+            trainable = trainable_cls(dict(config))
+            for _ in range(stop["training_iteration"]):
+                result = trainable.step()
+            trials.append((trainable.config, result))
+        best_config, best_result = max(trials, key=lambda trial: trial[1]["score"])
+        return types.SimpleNamespace(
+            get_best_config=lambda **_: best_config,
+            get_best_trial=lambda **_: types.SimpleNamespace(last_result=best_result),
+        )
+
+
+class TestHyperparameterTunerRay:
+    """Ray Tune 튜닝 테스트 클래스 (Ray 대역 사용)"""
+
+    SEARCH_SPACE = {"learning_rate": {"type": "float", "low": 0.001, "high": 0.1}}
+
+    @pytest.fixture
+    def fake_tune(self, monkeypatch):
+        fake = _FakeTune()
+        monkeypatch.setattr(hyperparameter_tuning, "RAY_TUNE_AVAILABLE", True)
+        monkeypatch.setattr(hyperparameter_tuning, "tune", fake, raising=False)
+        monkeypatch.setattr(
+            hyperparameter_tuning,
+            "PopulationBasedTraining",
+            lambda **kwargs: types.SimpleNamespace(**kwargs),
+            raising=False,
+        )
+        return fake
+
+    def test_one_shot_objective_runs_once_per_sample(self, fake_tune):
+        """반복 번호를 받지 않는 목적 함수는 샘플마다 한 번만 실행되는지 테스트"""
+        calls = []
+
+        def objective(config):
+            calls.append(config)
+            return config["learning_rate"]
+
+        tuner = HyperparameterTuner({"hyperparameter_tuning": {"max_training_iterations": 5}})
+        result = tuner.tune_with_ray(objective, self.SEARCH_SPACE, num_samples=3)
 
-    def test_reward_calculation_with_improvement(self):
-        """개선이 있는 경우 보상 계산 테스트"""
-        config = {}
-        calculator = RewardCalculator(config)
+        assert len(calls) == 3
+        assert fake_tune.run_kwargs["stop"] == {"training_iteration": 1}
+        assert fake_tune.run_kwargs["scheduler"] is None
+        assert result["best_value"] == pytest.approx(0.001)
 
-        previous_metrics = {"overall_responsible_ai_score": 0.7}
-        current_metrics = {"overall_responsible_ai_score": 0.8}
+    def test_iterative_objective_uses_pbt(self, fake_tune):
+        """반복 번호를 받는 목적 함수는 PBT로 여러 반복 실행되는지 테스트"""
+        iterations = []
 
-        reward = calculator.calculate_reward(current_metrics, previous_metrics)
+        def objective(config, iteration):
+            iterations.append(iteration)
+            return {"score": config["learning_rate"] * (iteration + 1)}
 
-        assert reward > 0.8  # 개선 보너스 포함
+        tuner = HyperparameterTuner({"hyperparameter_tuning": {"max_training_iterations": 4}})
+        result = tuner.tune_with_ray(objective, self.SEARCH_SPACE, num_samples=2)
 
+        assert iterations == [0, 1, 2, 3] * 2
+        assert fake_tune.run_kwargs["stop"] == {"training_iteration": 4}
+        assert fake_tune.run_kwargs["scheduler"].metric == "score"
+        assert result["best_value"] == pytest.approx(0.004)
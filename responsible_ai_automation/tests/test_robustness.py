@@ -4,14 +4,15 @@
 
 import pytest
 import numpy as np
-from sklearn.ensemble import RandomForestClassifier
 from src.evaluation.robustness import RobustnessEvaluator
 
+_RNG = np.random.default_rng(0)
+
 
 class TestRobustnessEvaluator:
     """견고성 평가 테스트 클래스"""
 
-    def test_robustness_evaluation_basic(self):
+    def test_robustness_evaluation_basic(self, trained_rf_small):
         """기본 견고성 평가 테스트"""
         config = {
             "robustness": {
@@ -22,10 +23,7 @@ class TestRobustnessEvaluator:
 
         evaluator = RobustnessEvaluator(config)
 
-        model = RandomForestClassifier(n_estimators=10, random_state=42)
-        X = np.random.rand(50, 5)
-        y = np.random.randint(0, 2, 50)
-        model.fit(X, y)
+        model, X, y, _ = trained_rf_small
 
         results = evaluator.evaluate(model, X, y)
 
@@ -35,7 +33,8 @@ class TestRobustnessEvaluator:
         assert isinstance(results["overall_robustness_score"], float)
         assert 0.0 <= results["overall_robustness_score"] <= 1.0
 
-    def test_robustness_evaluation_with_ood_detection(self):
+    @pytest.mark.slow
+    def test_robustness_evaluation_with_ood_detection(self, trained_rf_small):
         """분포 외 데이터 감지를 포함한 견고성 평가 테스트"""
         config = {
             "robustness": {
@@ -46,18 +45,15 @@ class TestRobustnessEvaluator:
 
         evaluator = RobustnessEvaluator(config)
 
-        model = RandomForestClassifier(n_estimators=10, random_state=42)
-        X_train = np.random.rand(50, 5)
-        X_test = np.random.rand(30, 5) + 0.5  # 분포가 다른 테스트 데이터
-        y = np.random.randint(0, 2, 50)
-        model.fit(X_train, y)
+        model, X_train, y, _ = trained_rf_small
+        X_test = _RNG.random((30, 5)) + 0.5  # 분포가 다른 테스트 데이터
 
         results = evaluator.evaluate(model, X_train, y, X_test=X_test)
 
         assert "adversarial_robustness" in results["metrics"]
         assert "out_of_distribution_detection" in results["metrics"]
 
-    def test_robustness_evaluation_without_test_data(self):
+    def test_robustness_evaluation_without_test_data(self, trained_rf_small):
         """테스트 데이터가 없는 경우 견고성 평가 테스트"""
         config = {
             "robustness": {
@@ -68,10 +64,7 @@ class TestRobustnessEvaluator:
 
         evaluator = RobustnessEvaluator(config)
 
-        model = RandomForestClassifier(n_estimators=10, random_state=42)
-        X = np.random.rand(50, 5)
-        y = np.random.randint(0, 2, 50)
-        model.fit(X, y)
+        model, X, y, _ = trained_rf_small
 
         results = evaluator.evaluate(model, X, y, X_test=None)
 
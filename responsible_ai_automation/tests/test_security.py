@@ -0,0 +1,127 @@
+"""
+보안 유틸리티 테스트
+"""
+
+import base64
+import os
+from unittest.mock import patch
+
+import pytest
+from src.utils import security
+from src.utils.security import APIKeyManager, RateLimiter
+
+
+class _FakeClock:
+    """time.monotonic 대역 (수동으로 진행하는 시계)"""
+
+    def __init__(self, start: float = 1000.0):
+        self.now = start
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+class TestRateLimiter:
+    """Rate Limiting 테스트 클래스"""
+
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        """security 모듈의 time.monotonic을 수동 시계로 교체"""
+        fake_clock = _FakeClock()
+        monkeypatch.setattr(security.time, "monotonic", fake_clock)
+        return fake_clock
+
+    @pytest.fixture
+    def limiter(self):
+        """윈도우 60초, 한도 3회 설정"""
+        return RateLimiter({"security": {"rate_limiting": {"limit": 3, "window_seconds": 60}}})
+
+    def test_limit_enforced(self, clock, limiter):
+        """윈도우 안에서 한도를 넘는 요청이 거부되고 식별자별로 따로 집계되는지 테스트"""
+        assert [limiter.is_allowed("user") for _ in range(4)] == [True, True, True, False]
+        assert limiter.get_remaining("user") == 0
+
+        assert limiter.is_allowed("other")
+        assert limiter.get_remaining("other") == 2
+
+        # 거부된 요청은 기록되지 않음
+        assert len(limiter.requests["user"]) == 3
+
+    def test_window_expiry(self, clock, limiter):
+        """윈도우가 지나면 오래된 요청부터 만료되어 다시 허용되는지 테스트"""
+        limiter.is_allowed("user")
+        clock.advance(30)
+        limiter.is_allowed("user")
+        limiter.is_allowed("user")
+        assert not limiter.is_allowed("user")
+
+        # 첫 요청만 윈도우를 벗어남 (경계 시각에 만료)
+        clock.advance(30)
+        assert limiter.get_remaining("user") == 1
+        assert limiter.is_allowed("user")
+        assert not limiter.is_allowed("user")
+
+        clock.advance(60)
+        assert limiter.get_remaining("user") == 3
+
+    def test_custom_limit_and_disabled(self, clock):
+        """호출별 한도 지정과 비활성화 설정을 테스트"""
+        limiter = RateLimiter({"security": {"rate_limiting": {"limit": 1}}})
+        assert limiter.is_allowed("user", limit=2)
+        assert limiter.is_allowed("user", limit=2)
+        assert not limiter.is_allowed("user", limit=2)
+
+        disabled = RateLimiter({"security": {"rate_limiting": {"enabled": False, "limit": 1}}})
+        assert all(disabled.is_allowed("user") for _ in range(5))
+
+
+class TestAPIKeyManager:
+    """API 키 관리 테스트 클래스"""
+
+    def test_rotate_api_keys(self, tmp_path, monkeypatch):
+        """키 개수/고유성/길이와 os.urandom 단일 호출을 테스트"""
+        # 암호화 없이 저장하여 파일 내용을 그대로 비교
+        monkeypatch.setattr(security, "CRYPTOGRAPHY_AVAILABLE", False)
+        manager = APIKeyManager({"security": {"key_storage_path": str(tmp_path)}})
+        key_names = [f"KEY_{i}" for i in range(5)]
+
+        with patch.object(security.os, "urandom", wraps=os.urandom) as urandom:
+            rotated = manager.rotate_api_keys(key_names)
+
+        urandom.assert_called_once_with(32 * len(key_names))
+        assert list(rotated) == key_names
+        keys = list(rotated.values())
+        assert len(set(keys)) == len(key_names)
+        for key_name, key in rotated.items():
+            # 32바이트를 패딩 없는 URL-safe base64로 인코딩하면 43자
+            assert len(key) == 43
+            assert len(base64.urlsafe_b64decode(key + "=")) == 32
+            assert (tmp_path / f"{key_name}.key").read_text() == key
+
+    def test_fernet_derived_once_per_instance(self, tmp_path, monkeypatch):
+        """키 유도가 인스턴스마다 한 번만 수행되고 인스턴스 간에 공유되지 않는지 테스트"""
+        if not security.CRYPTOGRAPHY_AVAILABLE:
+            pytest.skip("cryptography 미설치")
+        monkeypatch.setenv("MASTER_ENCRYPTION_KEY", "test-master-key")
+        derive_calls = []
+        derive = security._derive_fernet
+        monkeypatch.setattr(
+            security, "_derive_fernet", lambda key: derive_calls.append(key) or derive(key)
+        )
+        config = {"security": {"key_storage_path": str(tmp_path)}}
+
+        manager = APIKeyManager(config)
+        encrypted = [manager._encrypt_key(f"secret_{i}") for i in range(3)]
+        assert [manager._decrypt_key(token) for token in encrypted] == [
+            f"secret_{i}" for i in range(3)
+        ]
+        assert len(derive_calls) == 1
+
+        # 같은 마스터 키라도 다른 인스턴스는 자체적으로 유도 (전역 캐시 없음)
+        other = APIKeyManager(config)
+        assert other._decrypt_key(encrypted[0]) == "secret_0"
+        assert len(derive_calls) == 2
+        assert not hasattr(derive, "cache_info")
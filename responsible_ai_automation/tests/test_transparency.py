@@ -2,16 +2,41 @@
 투명성 평가 모듈 테스트
 """
 
+import types
+
 import pytest
 import numpy as np
 from sklearn.ensemble import RandomForestClassifier
+from src.evaluation import transparency
 from src.evaluation.transparency import TransparencyEvaluator
 
 
+@pytest.fixture(autouse=True)
+def _mock_explainers(monkeypatch):
+    """
+    SHAP/순열 중요도 계산을 고정 값으로 대체
+
+    이 모듈은 결과 형식과 점수 범위만 검증하며, 실제 계산 경로는
+    test_evaluation.py의 종합 평가 테스트에서 확인
+    """
+    monkeypatch.setattr(
+        transparency,
+        "shap",
+        types.SimpleNamespace(
+            TreeExplainer=lambda model: types.SimpleNamespace(shap_values=np.zeros_like)
+        ),
+    )
+    monkeypatch.setattr(
+        transparency,
+        "permutation_importance",
+        lambda model, X, y, **kwargs: types.SimpleNamespace(importances_mean=np.ones(X.shape[1])),
+    )
+
+
 class TestTransparencyEvaluator:
     """투명성 평가 테스트 클래스"""
 
-    def test_transparency_evaluation_basic(self):
+    def test_transparency_evaluation_basic(self, trained_rf_small):
         """기본 투명성 평가 테스트"""
         config = {
             "transparency": {
@@ -22,10 +47,7 @@ class TestTransparencyEvaluator:
 
         evaluator = TransparencyEvaluator(config)
 
-        model = RandomForestClassifier(n_estimators=10, random_state=42)
-        X = np.random.rand(50, 5)
-        y = np.random.randint(0, 2, 50)
-        model.fit(X, y)
+        model, X, y, _ = trained_rf_small
 
         results = evaluator.evaluate(model, X, y)
 
@@ -35,7 +57,7 @@ class TestTransparencyEvaluator:
         assert isinstance(results["overall_transparency_score"], float)
         assert 0.0 <= results["overall_transparency_score"] <= 1.0
 
-    def test_transparency_evaluation_with_all_metrics(self):
+    def test_transparency_evaluation_with_all_metrics(self, trained_rf_small):
         """모든 메트릭을 포함한 투명성 평가 테스트"""
         config = {
             "transparency": {
@@ -46,10 +68,7 @@ class TestTransparencyEvaluator:
 
         evaluator = TransparencyEvaluator(config)
 
-        model = RandomForestClassifier(n_estimators=10, random_state=42)
-        X = np.random.rand(50, 5)
-        y = np.random.randint(0, 2, 50)
-        model.fit(X, y)
+        model, X, y, _ = trained_rf_small
 
         results = evaluator.evaluate(model, X, y)
 
@@ -64,7 +83,7 @@ class TestTransparencyEvaluator:
         evaluator = TransparencyEvaluator(config)
 
         # RandomForest 모델
-        model = RandomForestClassifier(n_estimators=50, random_state=42)
+        model = RandomForestClassifier(n_estimators=3, max_depth=4, random_state=42, n_jobs=1)
         complexity = evaluator._calculate_complexity(model)
         assert 0.0 <= complexity <= 1.0
 